@@ -0,0 +1,234 @@
+"""Benchmark suite for ladder.
+
+Runs offline and saves results as JSON so that runs (e.g. of different
+releases) can be compared::
+
+    python benchmarks/run.py --output before.json
+    python benchmarks/run.py --output after.json
+    python benchmarks/run.py --compare before.json after.json
+"""
+
+from __future__ import print_function
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import ladder  # noqa
+from ladder import (  # noqa
+    API,
+    BytesPath,
+    DelimitedPath,
+    OSPath,
+    URLPath,
+    delimitedpathjoin,
+    iterflatten,
+    ospathjoin,
+    urlpathjoin)
+
+
+class StubClient(object):
+    """HTTP client stub which returns its arguments without any I/O."""
+    def get(self, url, *args, **kargs):
+        return url
+
+    def post(self, url, *args, **kargs):
+        return url
+
+
+def nested(depth):
+    """Return list nested `depth` levels deep."""
+    items = ['leaf']
+    for index in range(depth):
+        items = [str(index), items]
+    return items
+
+
+def chain(path, depth):
+    """Return `path` extended with `depth` generative attribute/call steps."""
+    for index in range(depth):
+        path = path.segment(index + 1)
+    return path
+
+
+def join_cases():
+    for size in (1, 10, 100):
+        paths = ['/segment{0}/'.format(index) for index in range(size)]
+        yield ('delimitedpathjoin', {'segments': size},
+               lambda paths=paths: delimitedpathjoin('/', paths))
+        yield ('urlpathjoin', {'segments': size},
+               lambda paths=paths: urlpathjoin(paths))
+        yield ('ospathjoin', {'segments': size},
+               lambda paths=paths: ospathjoin(paths))
+
+
+def flatten_cases():
+    for depth in (10, 100, 500):
+        items = nested(depth)
+        yield ('iterflatten-deep', {'depth': depth},
+               lambda items=items: list(iterflatten(items)))
+
+    for width in (10, 1000):
+        items = [[str(index), [index]] for index in range(width)]
+        yield ('iterflatten-wide', {'width': width},
+               lambda items=items: list(iterflatten(items)))
+
+
+def generation_cases():
+    roots = [
+        ('URLPath', URLPath('https://api.example.com', params={'key': 'a'})),
+        ('DelimitedPath', DelimitedPath('root', delimiter=':')),
+        ('OSPath', OSPath('/root')),
+    ]
+
+    for name, root in roots:
+        for depth in (1, 10, 50):
+            yield ('chain-' + name, {'depth': depth},
+                   lambda root=root, depth=depth: str(chain(root, depth)))
+
+
+def expand_cases():
+    text = DelimitedPath('user', delimiter=':')
+    keys = BytesPath(b'user', delimiter=b':')
+    ids = list(range(1, 10001))
+
+    yield ('expand-keys', {'mode': 'text+encode'},
+           lambda: [path.encode('utf-8') for path in text.__expand__(ids)])
+    yield ('expand-keys', {'mode': 'bytes'}, lambda: keys.__expand__(ids))
+
+
+def render_cases():
+    for count in (0, 10, 100):
+        url = URLPath('https://api.example.com/v1/users',
+                      params=[('param{0}'.format(index), index)
+                              for index in range(count)])
+        yield ('URLPath.__renderpathway__', {'params': count},
+               url.__renderpathway__)
+        yield ('URLPath.__getpathway__-cached', {'params': count},
+               url.__getpathway__)
+
+
+def api_cases():
+    api = API(StubClient(), 'https://api.example.com', params={'key': 'a'})
+    users = api.users(1)
+
+    yield ('API-dispatch', {'generate': False}, lambda: users.GET())
+    yield ('API-dispatch', {'generate': True}, lambda: api.users(1).GET())
+
+
+CASES = [join_cases, flatten_cases, generation_cases, expand_cases,
+         render_cases, api_cases]
+
+
+def measure(func, repeat, min_time):
+    """Return timings of `func` as dict with per call times in seconds."""
+    number = 1
+
+    # Find a call count which takes at least `min_time` per run.
+    while True:
+        elapsed = timeit.timeit(func, number=number)
+        if elapsed >= min_time:
+            break
+        number *= 10 if elapsed < min_time / 10 else 2
+
+    timings = [timing / number
+               for timing in timeit.repeat(func, number=number, repeat=repeat)]
+
+    return {
+        'number': number,
+        'repeat': repeat,
+        'best': min(timings),
+        'mean': sum(timings) / len(timings),
+    }
+
+
+def run(pattern=None, repeat=5, min_time=0.1):
+    """Run benchmark cases whose name contains `pattern` and return results.
+    """
+    results = []
+
+    for cases in CASES:
+        for name, params, func in cases():
+            if pattern and pattern not in name:
+                continue
+
+            result = {'name': name, 'params': params}
+            result.update(measure(func, repeat, min_time))
+            results.append(result)
+
+            print('{0:<34} {1:<20} {2:>12.3f} us'.format(
+                name, format_params(params), result['best'] * 1e6))
+
+    return {
+        'ladder': ladder.__version__,
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        'results': results,
+    }
+
+
+def compare(before, after):
+    """Print per case ratio of best timings between two results files."""
+    before = dict((result_key(result), result) for result in before['results'])
+
+    for result in after['results']:
+        previous = before.get(result_key(result))
+
+        if previous is None:
+            continue
+
+        ratio = result['best'] / previous['best']
+        print('{0:<34} {1:<20} {2:>10.3f} us {3:>10.3f} us {4:>7.2f}x'.format(
+            result['name'],
+            format_params(result['params']),
+            previous['best'] * 1e6,
+            result['best'] * 1e6,
+            ratio))
+
+
+def result_key(result):
+    return (result['name'], format_params(result['params']))
+
+
+def format_params(params):
+    return ','.join('{0}={1}'.format(key, params[key])
+                    for key in sorted(params))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-o', '--output',
+                        help='Save results as JSON to this file.')
+    parser.add_argument('-k', '--filter',
+                        help='Only run cases whose name contains this.')
+    parser.add_argument('-r', '--repeat', type=int, default=5,
+                        help='Number of timing runs per case.')
+    parser.add_argument('-t', '--min-time', type=float, default=0.1,
+                        help='Minimum seconds per timing run.')
+    parser.add_argument('-c', '--compare', nargs=2,
+                        metavar=('BEFORE', 'AFTER'),
+                        help='Compare two saved results files.')
+    args = parser.parse_args()
+
+    if args.compare:
+        with open(args.compare[0]) as before, open(args.compare[1]) as after:
+            compare(json.load(before), json.load(after))
+        return
+
+    results = run(args.filter, args.repeat, args.min_time)
+
+    if args.output:
+        with open(args.output, 'w') as fp:
+            json.dump(results, fp, indent=2, sort_keys=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,11 @@
+"""Test configuration.
+"""
+
+import sys
+
+
+# Skip modules using async/await syntax on Python versions without it.
+collect_ignore = []
+
+if sys.version_info < (3, 5):
+    collect_ignore += ['ladder/asyncapi.py', 'tests/test_asyncapi.py']
@@ -1,22 +1,13 @@
 """Package API
+
+Public names are imported from their submodules on first access (e.g. ``from
+ladder import DelimitedPath`` doesn't import the API clients) where supported
+and otherwise when the package is imported.
 """
 
-from .ladder import (
-    Ladder)
-from .urlpath import (
-    URLPath)
-from .ospath import (
-    OSPath)
-from .delimitedpath import (
-    DelimitedPath)
-from .api import (
-    API)
-from .utils import (
-    delimitedpathjoin,
-    ospathjoin,
-    urlpathjoin,
-    flatten,
-    iterflatten)
+import sys
+
+from ._compat import ASYNC
 
 from .__meta__ import (
     __title__,
@@ -27,14 +18,101 @@ from .__meta__ import (
     __email__,
     __license__)
 
+# Public names are imported on first access by __getattr__ so most of them
+# aren't defined here until then.
+# pylint: disable=undefined-all-variable
 __all__ = [
     'Ladder',
     'URLPath',
     'OSPath',
     'DelimitedPath',
+    'BytesPath',
     'API',
+    'Params',
+    'LRUCache',
+    'cached',
+    'RouteTemplate',
+    'RouteIndex',
+    'RouteSnapshot',
+    'dumpsnapshot',
+    'Hook',
+    'RouteStats',
+    'ResponseCache',
+    'AdaptiveConcurrency',
+    'TokenBucket',
     'ospathjoin',
     'delimitedpathjoin',
     'urlpathjoin',
     'flatten',
     'iterflatten']
+# pylint: enable=undefined-all-variable
+
+# Submodule of each public name.
+_SUBMODULES = {
+    'Ladder': 'ladder',
+    'URLPath': 'urlpath',
+    'OSPath': 'ospath',
+    'DelimitedPath': 'delimitedpath',
+    'BytesPath': 'delimitedpath',
+    'API': 'api',
+    'Params': 'params',
+    'LRUCache': 'cache',
+    'cached': 'cache',
+    'RouteTemplate': 'template',
+    'RouteIndex': 'router',
+    'RouteSnapshot': 'snapshot',
+    'dumpsnapshot': 'snapshot',
+    'Hook': 'hooks',
+    'RouteStats': 'hooks',
+    'ResponseCache': 'responsecache',
+    'AdaptiveConcurrency': 'limits',
+    'TokenBucket': 'limits',
+    'ospathjoin': 'utils',
+    'delimitedpathjoin': 'utils',
+    'urlpathjoin': 'utils',
+    'flatten': 'utils',
+    'iterflatten': 'utils'}
+
+if ASYNC:  # pragma: no cover
+    __all__.append('AsyncAPI')
+    _SUBMODULES['AsyncAPI'] = 'asyncapi'
+
+
+def _importmodule(submodule):
+    """Import and return our `submodule`. ``__import__`` is used instead of
+    ``importlib`` so that ``python -X importtime`` reports the import.
+    """
+    modname = '{0}.{1}'.format(__name__, submodule)
+    __import__(modname)
+    return sys.modules[modname]
+
+
+def _importname(name):
+    """Import public `name` from its submodule into our namespace."""
+    value = getattr(_importmodule(_SUBMODULES[name]), name)
+    globals()[name] = value
+    return value
+
+
+if sys.version_info >= (3, 7):
+    def __getattr__(name):
+        if name in _SUBMODULES:
+            return _importname(name)
+
+        if not name.startswith('__'):
+            # Submodules (e.g. ``ladder.utils``) are also imported on access.
+            try:
+                return _importmodule(name)
+            except ImportError as exc:
+                if exc.name != '{0}.{1}'.format(__name__, name):
+                    raise
+
+        raise AttributeError('module {0!r} has no attribute {1!r}'
+                             .format(__name__, name))
+
+    def __dir__():
+        return sorted(set(globals()) | set(__all__))
+else:  # pragma: no cover
+    # Module __getattr__ isn't supported so import everything up front.
+    for _name in __all__:
+        _importname(_name)
@@ -7,21 +7,50 @@ import sys
 
 PY3 = sys.version_info[0] == 3
 
-if PY3:  # pragma: no cover
-    from urllib.parse import (
-        urlencode, urlsplit, urlunsplit, parse_qs, parse_qsl)
+# Whether async/await syntax is supported.
+ASYNC = sys.version_info >= (3, 5)
 
+# Names of URL parsing functions imported on first access where supported
+# since importing urllib is a large part of our import time. Modules using
+# them should look them up at call time, e.g. ``_compat.urlsplit(url)``.
+URL_NAMES = ('urlencode', 'urljoin', 'urlsplit', 'urlunsplit', 'parse_qs',
+             'parse_qsl', 'SplitResult')
+
+if PY3:  # pragma: no cover
     text_type = str
 
     iterkeys = lambda d: iter(d.keys())
     itervalues = lambda d: iter(d.values())
     iteritems = lambda d: iter(d.items())
 else:  # pragma: no cover
-    from urllib import urlencode
-    from urlparse import urlsplit, urlunsplit, parse_qs, parse_qsl
-
     text_type = unicode
 
     iterkeys = lambda d: d.iterkeys()
     itervalues = lambda d: d.itervalues()
     iteritems = lambda d: d.iteritems()
+
+if sys.version_info >= (3, 7):  # pragma: no cover
+    def __getattr__(name):
+        if name not in URL_NAMES:
+            raise AttributeError('module {0!r} has no attribute {1!r}'
+                                 .format(__name__, name))
+
+        import urllib.parse
+
+        for url_name in URL_NAMES:
+            globals()[url_name] = getattr(urllib.parse, url_name)
+
+        return globals()[name]
+elif PY3:  # pragma: no cover
+    from urllib.parse import (
+        urlencode, urljoin, urlsplit, urlunsplit, parse_qs, parse_qsl,
+        SplitResult)
+else:  # pragma: no cover
+    from urllib import urlencode
+    from urlparse import (
+        urljoin, urlsplit, urlunsplit, parse_qs, parse_qsl, SplitResult)
+
+try:  # pragma: no cover
+    from time import perf_counter as timer
+except ImportError:  # pragma: no cover
+    from time import time as timer
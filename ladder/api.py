@@ -1,23 +1,58 @@
 """API client wrapper.
 """
 
+from contextlib import contextmanager
 from functools import partial
 
+from .hooks import Call
+from .limits import adaptiveconcurrency, ratebucket, recordcall
+from .responsecache import CACHEABLE_METHODS, requestkey
+from .singleflight import SingleFlight
 from .urlpath import URLPath
+from .utils import threadmap
 
 
 class API(URLPath):
     """Add URL generation to an HTTP request client. Requires that the `client`
     support HTTP verbs as lowercase methods. An example client would be the one
     from Requests package.
+
+    Each of `hooks` has its ``before`` and ``after`` methods called around
+    every request made by this instance and the endpoints generated from it.
+    See ``ladder.hooks``.
+
+    If `response_cache` is a ``ResponseCache``, then responses to ``HEAD``,
+    ``GET`` and ``OPTIONS`` requests are cached in it. See
+    ``ladder.responsecache``.
+
+    If `coalesce`, then concurrent ``HEAD``, ``GET`` and ``OPTIONS`` requests
+    with the same URL and arguments share a single request and all of them
+    return its response.
+
+    Requests wait for a token of `rate_limit`, which is a ``TokenBucket`` or a
+    dict of them keyed by netloc, and for a slot of `concurrency`, which is
+    the maximum number of concurrent requests or an ``AdaptiveConcurrency``.
+    See ``ladder.limits``. Limits are shared by every endpoint generated from
+    this instance.
     """
-    __attrs__ = [
+    __attrs__ = URLPath.__attrs__ + [
         '__client__',
-        '__pathway__',
-        '__params__',
-        '__append_slash__',
-        '__upper_methods__'
+        '__upper_methods__',
+        '__methods__',
+        '__hooks__',
+        '__response_cache__',
+        '__flights__',
+        '__rate_limit__',
+        '__concurrency__'
     ]
+    __slots__ = ('__client__',
+                 '__upper_methods__',
+                 '__methods__',
+                 '__hooks__',
+                 '__response_cache__',
+                 '__flights__',
+                 '__rate_limit__',
+                 '__concurrency__')
 
     __http_methods__ = [
         'head',
@@ -30,22 +65,236 @@ class API(URLPath):
     ]
 
     def __init__(self, client, pathway='', params=None,
-                 append_slash=False, upper_methods=True):
+                 append_slash=False, upper_methods=True, hooks=None,
+                 response_cache=None, coalesce=False, rate_limit=None,
+                 concurrency=None):
         super(API, self).__init__(pathway, params, append_slash)
         self.__client__ = client
         self.__upper_methods__ = upper_methods
+        self.__hooks__ = tuple(hooks or ())
+        self.__response_cache__ = response_cache
+        self.__flights__ = SingleFlight() if coalesce else None
+        self.__rate_limit__ = rate_limit
+        self.__concurrency__ = adaptiveconcurrency(concurrency)
+
+        # Set client proxy methods accessed during the getattr call. The set
+        # of method names is shared by all instances with the same methods.
+        self.__methods__ = methodnames(self.__http_methods__, upper_methods)
 
-        # Dynamically set client proxy methods accessed during the getattr
-        # call.
-        self.__methods__ = [
-            method.upper() if self.__upper_methods__ else method
-            for method in self.__http_methods__
-        ]
+    def __statekey__(self):
+        """Return our URL state key followed by the identities of our client
+        and request settings, which are shared by every endpoint generated
+        from the same instance and needn't be hashable.
+        """
+        return (URLPath.__statekey__(self) +
+                tuple(id(getattr(self, attr))
+                      for attr in self.__attrs__[len(URLPath.__attrs__):]))
 
     def __getattr__(self, attr):
         if attr in self.__methods__:
-            # Proxy call to client method with url bound to first argument.
-            return partial(getattr(self.__client__, attr.lower()),
-                           self.__getpathway__())
+            return self.__proxy__(attr.lower())
         else:
             return super(API, self).__getattr__(attr)
+
+    def __proxy__(self, method):
+        """Return proxy of client `method` with url bound to first argument."""
+        proxy = partial(getattr(self.__client__, method),
+                        self.__getpathway__())
+
+        if self.__hooks__ or self.__concurrency__ is not None:
+            proxy = partial(self.__hookcall__, method, proxy)
+
+        if self.__rate_limit__ is not None or self.__concurrency__ is not None:
+            proxy = partial(self.__limitedcall__, proxy)
+
+        if (method in CACHEABLE_METHODS and
+                (self.__response_cache__ is not None or
+                 self.__flights__ is not None)):
+            proxy = partial(self.__sharedcall__, method, proxy)
+
+        return proxy
+
+    def __sharedcall__(self, method, proxy, *args, **kargs):
+        """Return response of `proxy` from our response cache or shared with
+        an identical call in flight, if either is set.
+        """
+        key = requestkey(self, method, args, kargs)
+
+        if self.__flights__ is not None:
+            proxy = partial(self.__flights__.do, key, proxy)
+
+        if self.__response_cache__ is not None:
+            return self.__response_cache__.fetch(key, proxy, *args, **kargs)
+
+        return proxy(*args, **kargs)
+
+    def __limitedcall__(self, proxy, *args, **kargs):
+        """Call `proxy` once our rate and concurrency limits allow it."""
+        bucket = ratebucket(self.__rate_limit__, self.__netloc__)
+        concurrency = self.__concurrency__
+
+        if concurrency is None:
+            if bucket is not None:
+                bucket.acquire()
+            return proxy(*args, **kargs)
+
+        with concurrency:
+            if bucket is not None:
+                bucket.acquire()
+
+            return proxy(*args, **kargs)
+
+    def __hookcall__(self, method, proxy, *args, **kargs):
+        """Call `proxy` surrounded by our hooks and record it for our
+        concurrency limit.
+        """
+        with self.__recordcall__(method, args, kargs,
+                                 self.__concurrency__) as call:
+            call.response = proxy(*args, **kargs)
+
+        return call.response
+
+    @contextmanager
+    def __recordcall__(self, method, args, kargs, concurrency=None):
+        """Context manager which records the request made in it as a `Call`
+        for our hooks and adapts the limit of `concurrency`, if given, to it.
+        The request's response is set as the ``response`` of the call.
+        """
+        call = Call(self, method, self.__getpathway__(), args, kargs)
+        call.start(self.__hooks__)
+
+        try:
+            yield call
+        except Exception as exc:
+            call.finish(self.__hooks__, exception=exc)
+            recordcall(concurrency, call)
+            raise
+
+        call.finish(self.__hooks__, call.response)
+        recordcall(concurrency, call)
+
+    def __map__(self, method, items, *args, **kargs):
+        """Call HTTP `method` for the child endpoint generated from each item
+        in `items` on a bounded thread pool and return an iterator of the
+        results. Any other arguments are passed to each call.
+
+        Keyword Args:
+            max_workers (int): Maximum number of threads. Defaults to ``32``.
+            ordered (bool): Whether to return results in the order of `items`.
+                Otherwise, ``(item, result)`` tuples are returned as the calls
+                complete. Defaults to ``True``.
+            return_exceptions (bool): Whether to return exceptions raised by a
+                call in place of its result. Otherwise, the exception is raised
+                when its result is reached. Defaults to ``False``.
+
+        Requires ``concurrent.futures`` (available as the ``futures`` package
+        on Python 2).
+        """
+        max_workers = kargs.pop('max_workers', 32)
+        ordered = kargs.pop('ordered', True)
+        return_exceptions = kargs.pop('return_exceptions', False)
+        method = method.lower()
+
+        def call(item):
+            return self(item).__proxy__(method)(*args, **kargs)
+
+        results = threadmap(call, items, max_workers, ordered)
+
+        try:
+            for item, future in results:
+                try:
+                    result = future.result()
+                except Exception as exc:  # pylint: disable=broad-except
+                    if not return_exceptions:
+                        raise
+                    result = exc
+
+                yield result if ordered else (item, result)
+        finally:
+            results.close()
+
+    def __paginate__(self, method, *args, **kargs):
+        """Return iterator of the items of each page of results of calling
+        HTTP `method` starting with our endpoint. The next page is requested in
+        a background thread while the items of the current page are iterated
+        over. Any other arguments are passed to each call.
+
+        Keyword Args:
+            items (callable): Function which returns the items of a page given
+                its response. Defaults to iterating over the response.
+            page_param (str): Query param of the page number. Pages are
+                requested with it set to `start`, ``start + 1``, etc. until a
+                page has no items.
+            start (int): Number of the first page. Defaults to ``1``.
+            next_page (callable): Function which, given the response of a page,
+                returns ``None`` if it's the last page or else either a dict
+                of query params to replace (e.g. a cursor) or a URL (e.g. a
+                next link) for the next page. Used instead of `page_param`.
+
+        Requires ``concurrent.futures`` (available as the ``futures`` package
+        on Python 2).
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        items = kargs.pop('items', None) or iter
+        page_param = kargs.pop('page_param', None)
+        page = kargs.pop('start', 1)
+        next_page = kargs.pop('next_page', None)
+        method = method.lower()
+        endpoint = self
+
+        if page_param is not None and next_page is None:
+            endpoint = self.__replaceparams__(**{page_param: page})
+
+        executor = ThreadPoolExecutor(1)
+        future = executor.submit(endpoint.__proxy__(method), *args, **kargs)
+
+        try:
+            while future is not None:
+                response = future.result()
+                results = list(items(response))
+
+                if next_page is not None:
+                    location = next_page(response)
+                elif page_param is not None and results:
+                    page += 1
+                    location = {page_param: page}
+                else:
+                    location = None
+
+                if location is None:
+                    future = None
+                else:
+                    if isinstance(location, dict):
+                        endpoint = endpoint.__replaceparams__(**location)
+                    else:
+                        endpoint = endpoint.__link__(location)
+
+                    future = executor.submit(endpoint.__proxy__(method),
+                                             *args,
+                                             **kargs)
+
+                for result in results:
+                    yield result
+        finally:
+            if future is not None:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+
+# Cache of client proxy method names keyed by HTTP methods and casing.
+METHOD_NAMES = {}
+
+
+def methodnames(http_methods, upper_methods):
+    """Return shared frozenset of client proxy method names for `http_methods`
+    using UPPERCASE names if `upper_methods` else lowercase.
+    """
+    key = (tuple(http_methods), upper_methods)
+
+    if key not in METHOD_NAMES:
+        METHOD_NAMES[key] = frozenset(method.upper() if upper_methods
+                                      else method
+                                      for method in http_methods)
+
+    return METHOD_NAMES[key]
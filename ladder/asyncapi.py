@@ -0,0 +1,209 @@
+"""Asyncio API client wrapper.
+"""
+
+import asyncio
+from functools import partial
+
+from .api import API
+from .limits import AdaptiveConcurrency, ratebucket
+from .responsecache import requestkey
+
+
+class AsyncAPI(API):
+    """Add URL generation to an asyncio HTTP request client. Requires that the
+    `client` support HTTP verbs as lowercase methods which return awaitables.
+    An example client would be the ``ClientSession`` from aiohttp package.
+
+    Calling an HTTP method returns a coroutine. If `concurrency` is given, then
+    at most that many requests run at once across all endpoints generated from
+    this instance. It may also be an ``AdaptiveConcurrency``.
+    """
+    __attrs__ = API.__attrs__ + ['__limiter__']
+    __slots__ = ('__limiter__',)
+
+    def __init__(self, client, pathway='', params=None, append_slash=False,
+                 upper_methods=True, hooks=None, response_cache=None,
+                 coalesce=False, rate_limit=None, concurrency=None):
+        super().__init__(client, pathway, params, append_slash, upper_methods,
+                         hooks, response_cache, rate_limit=rate_limit)
+        self.__flights__ = AsyncSingleFlight() if coalesce else None
+        self.__limiter__ = ConcurrencyLimit(concurrency)
+
+    def __proxy__(self, method):
+        """Return coroutine function proxy of client `method` with url bound to
+        first argument.
+        """
+        return partial(self.__request__, method)
+
+    async def __request__(self, method, *args, **kargs):
+        """Return response for client `method` from our response cache or
+        shared with an identical request in flight, if either is set, or else
+        await the request.
+        """
+        cache = self.__response_cache__
+        send = partial(self.__send__, method)
+
+        if cache is None and self.__flights__ is None:
+            return await send(*args, **kargs)
+
+        key = requestkey(self, method, args, kargs)
+
+        if self.__flights__ is not None:
+            send = partial(self.__flights__.do, key, send)
+
+        if cache is None:
+            return await send(*args, **kargs)
+
+        entry, kargs = cache.prepare(key, kargs)
+
+        if kargs is None:
+            return entry.response
+
+        return cache.update(key, entry, await send(*args, **kargs))
+
+    async def __send__(self, method, *args, **kargs):
+        """Await client `method` for our URL surrounded by our hooks once the
+        rate and concurrency limits allow it.
+        """
+        request = partial(getattr(self.__client__, method),
+                          self.__getpathway__())
+        limiter = self.__limiter__
+
+        async with limiter:
+            bucket = ratebucket(self.__rate_limit__, self.__netloc__)
+
+            if bucket is not None:
+                await asyncio.sleep(bucket.reserve())
+
+            if not self.__hooks__ and limiter.limit is None:
+                return await request(*args, **kargs)
+
+            with self.__recordcall__(method, args, kargs, limiter) as call:
+                call.response = await request(*args, **kargs)
+
+            return call.response
+
+    async def __gather__(self, method, items, *args,
+                         return_exceptions=False, **kargs):
+        """Concurrently call HTTP `method` for the child endpoint generated
+        from each item in `items` and return the results in the same order.
+        Any other arguments are passed to each call. If `return_exceptions`,
+        then exceptions are returned in place of their results instead of being
+        raised.
+        """
+        method = method.lower()
+        calls = [self(item).__request__(method, *args, **kargs)
+                 for item in items]
+
+        return await asyncio.gather(*calls,
+                                    return_exceptions=return_exceptions)
+
+
+class AsyncSingleFlight(object):
+    """Group of keyed coroutine calls in which concurrent calls with the same
+    key share the result of the first one instead of each being awaited. If
+    the first call is cancelled, then the calls sharing it are too.
+    """
+    def __init__(self):
+        self._flights = {}
+
+    def __reduce__(self):
+        return (AsyncSingleFlight, ())
+
+    def __len__(self):
+        return len(self._flights)
+
+    async def do(self, key, func, *args, **kargs):
+        """Return result of awaiting ``func(*args, **kargs)`` unless a call
+        with `key` is already in flight, in which case return its result or
+        raise its exception instead. A `key` of ``None`` is never coalesced.
+        """
+        if key is None:
+            return await func(*args, **kargs)
+
+        # Futures belong to an event loop so calls are only shared within one.
+        key = (asyncio.get_event_loop(), key)
+        flight = self._flights.get(key)
+
+        if flight is not None:
+            # Shielded so that cancelling one caller doesn't cancel the call.
+            return await asyncio.shield(flight)
+
+        flight = self._flights[key] = asyncio.get_event_loop().create_future()
+
+        try:
+            result = await func(*args, **kargs)
+        except BaseException as exc:
+            if isinstance(exc, asyncio.CancelledError):
+                flight.cancel()
+            else:
+                flight.set_exception(exc)
+                # Mark the exception retrieved in case nobody else waits.
+                flight.exception()
+            raise
+        else:
+            flight.set_result(result)
+        finally:
+            del self._flights[key]
+
+        return result
+
+
+class ConcurrencyLimit(object):
+    """Async context manager which limits how many tasks enter it at once. An
+    unset `limit` doesn't limit anything. The `limit` may be an
+    ``AdaptiveConcurrency`` whose current capacity is used instead. The
+    underlying condition is created lazily for the running event loop.
+    """
+    def __init__(self, limit=None):
+        self.limit = limit
+        self.active = 0
+        self._condition = None
+        self._loop = None
+
+    def __reduce__(self):
+        # The condition belongs to an event loop so it's recreated instead.
+        return (ConcurrencyLimit, (self.limit,))
+
+    @property
+    def capacity(self):
+        """Return current number of tasks allowed at once."""
+        if isinstance(self.limit, AdaptiveConcurrency):
+            return self.limit.capacity
+        return self.limit
+
+    def record(self, status, started, elapsed, failed=False):
+        """Adapt an ``AdaptiveConcurrency`` limit to a finished request."""
+        if isinstance(self.limit, AdaptiveConcurrency):
+            self.limit.record(status, started, elapsed, failed)
+
+    def condition(self):
+        """Return condition notified when a task exits for the running event
+        loop.
+        """
+        loop = asyncio.get_event_loop()
+
+        if self._loop is not loop:
+            self._condition = asyncio.Condition()
+            self._loop = loop
+
+        return self._condition
+
+    async def __aenter__(self):
+        if self.limit:
+            condition = self.condition()
+
+            async with condition:
+                await condition.wait_for(
+                    lambda: self.active < self.capacity)
+
+        self.active += 1
+
+    async def __aexit__(self, *exc_info):
+        self.active -= 1
+
+        if self.limit:
+            condition = self.condition()
+
+            async with condition:
+                condition.notify_all()
@@ -0,0 +1,115 @@
+"""Caching of generated paths.
+"""
+
+from collections import OrderedDict, namedtuple
+from threading import Lock
+
+from ._compat import iteritems
+
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+class LRUCache(object):
+    """Thread-safe mapping which evicts the least recently used item once it
+    holds more than `maxsize` items. Keeps count of cache hits and misses so
+    that `maxsize` can be tuned.
+    """
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._items = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def __reduce__(self):
+        # Cached items aren't pickled so unpickling gives an empty cache.
+        return (LRUCache, (self.maxsize,))
+
+    def get(self, key, default=None):
+        """Return cached value for `key` or `default` if not cached."""
+        with self._lock:
+            try:
+                value = self._items.pop(key)
+            except KeyError:
+                self.misses += 1
+                return default
+
+            # Reinsert to mark as most recently used.
+            self._items[key] = value
+            self.hits += 1
+
+            return value
+
+    def set(self, key, value):
+        """Cache `value` for `key` and evict the least recently used items in
+        excess of `maxsize`.
+        """
+        with self._lock:
+            self._items.pop(key, None)
+            self._items[key] = value
+
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+    def clear(self):
+        """Remove all cached items and reset hit/miss counters."""
+        with self._lock:
+            self._items.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self):
+        """Return cache statistics as `CacheInfo`."""
+        with self._lock:
+            return CacheInfo(self.hits,
+                             self.misses,
+                             self.maxsize,
+                             len(self._items))
+
+
+def cached(path, maxsize=128):
+    """Return copy of Ladder `path` which caches the children it generates
+    along with the children they generate. Children are keyed by their parent,
+    paths and params so that repeated access like ``api.users.get()`` returns
+    the same child instance instead of generating a new one. `maxsize` may
+    also be an existing `LRUCache` instance to share. The cache is available
+    as the ``__cache__`` attribute of the returned path and its children.
+    """
+    cache = maxsize if isinstance(maxsize, LRUCache) else LRUCache(maxsize)
+    path = path.__spawn__({})
+    path.__cache__ = cache
+
+    return path
+
+
+def childkey(parent, paths, params):
+    """Return cache key for child generated from `parent` with `paths` and
+    `params` or ``None`` if they are unhashable.
+    """
+    key = (parent,
+           typedkey(paths),
+           tuple((name, typedkey(value)) for name, value in iteritems(params)))
+
+    try:
+        hash(key)
+    except TypeError:
+        return None
+
+    return key
+
+
+def typedkey(value):
+    """Return `value` along with its type, and the types of the items of
+    tuples, so that equal values of different types like ``1``, ``1.0`` and
+    ``True``, which generate different paths, are different keys.
+    """
+    if isinstance(value, tuple):
+        return (tuple, tuple(typedkey(item) for item in value))
+    return (type(value), value)
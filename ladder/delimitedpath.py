@@ -1,18 +1,28 @@
 """Delimited path generation.
 """
 
-from .ladder import Ladder
-from .utils import delimitedpathjoin
+from .ladder import EXPAND_MARKER, Ladder
+from .utils import (
+    EMPTY_BYTES_SEGMENTS,
+    bytessegment,
+    delimitedpathsegments,
+    delimitedpathrender,
+    joinsegments,
+    pathsegments)
 
 
 class DelimitedPath(Ladder):
     """Generate delimited strings using Ladder interface."""
 
-    __attrs__ = ['__pathway__', '__delimiter__']
+    __attrs__ = ['__leading__', '__segments__', '__trailing__',
+                 '__delimiter__']
+    __slots__ = tuple(__attrs__)
 
     def __init__(self, pathway=None, delimiter=''):
-        self.__pathway__ = delimitedpathjoin(delimiter, pathway)
         self.__delimiter__ = delimiter
+        (self.__leading__,
+         self.__segments__,
+         self.__trailing__) = delimitedpathsegments(delimiter, (pathway,))
 
     def __add__(self, other):
         return self(other, delimiter=self.__delimiter__)
@@ -24,11 +34,113 @@ class DelimitedPath(Ladder):
     __rdiv__ = __radd__
     __rtruediv__ = __radd__
 
+    def __issegment__(self, path):
+        """Return whether `path` is added to our path as is, i.e. it has no
+        delimiter characters to strip from its ends.
+        """
+        return path == path.strip(self.__delimiter__)
+
+    def __statekey__(self):
+        """Return our rendered path and delimiter."""
+        return (self.__getpathway__(), self.__delimiter__)
+
+    def __renderpathway__(self):
+        """Render current path as string."""
+        return delimitedpathrender(self.__delimiter__, self.__segmentstate__)
+
+    @property
+    def __segmentstate__(self):
+        """Return ``(leading, segments, trailing)`` segment state."""
+        return (self.__leading__, self.__segments__, self.__trailing__)
+
+    def __preparestate__(self, *paths, **params):
+        """Extend our segments with paths."""
+        (leading,
+         segments,
+         trailing) = delimitedpathsegments(self.__delimiter__,
+                                           paths,
+                                           self.__segmentstate__)
+
+        return {'__leading__': leading,
+                '__segments__': segments,
+                '__trailing__': trailing}
+
+
+class BytesPath(DelimitedPath):
+    """Generate delimited bytes (e.g. cache or message queue keys) using
+    Ladder interface. Paths are joined as bytes without being decoded. Other
+    bytes-like paths are copied to bytes, text is UTF-8 encoded and anything
+    else is converted to text first, e.g. ``1`` becomes ``b'1'``.
+
+    ``bytes(path)`` returns the rendered path and ``str(path)`` returns it
+    decoded. Use ``__expand__`` or ``__iterproduct__`` to build many keys at
+    once, e.g. for a pipeline.
+    """
+    __slots__ = ()
+    __pathtype__ = bytes
+    __tosegment__ = staticmethod(bytessegment)
+
+    def __init__(self, pathway=None, delimiter=b''):
+        self.__delimiter__ = bytessegment(delimiter)
+        (self.__leading__,
+         self.__segments__,
+         self.__trailing__) = joinsegments(
+             self.__delimiter__,
+             pathsegments((pathway,), bytes, bytessegment),
+             EMPTY_BYTES_SEGMENTS)
+
+    def __str__(self):
+        path = self.__getpathway__()
+        # Python 2 str is bytes already.
+        return path if str is bytes else path.decode('utf-8', 'replace')
+
+    def __bytes__(self):
+        return self.__getpathway__()
+
+    def __iterexpand__(self, items):
+        """Return iterator of rendered child paths generated by calling our
+        self with each item in `items`. Ints and bytes which don't need to be
+        normalized are joined to the parts of our path rendered once without
+        checking them like ``__iterproduct__`` does.
+        """
+        delimiter = self.__delimiter__
+        marker = bytessegment(EXPAND_MARKER)
+
+        if marker in delimiter:
+            for item in items:
+                yield self(item).__getpathway__()
+            return
+
+        head, tail = (self.__spawn__(self.__preparestate__(marker))
+                      .__getpathway__()
+                      .split(marker))
+        # An int can only start or end with a delimiter made of its characters.
+        intsafe = not delimiter or delimiter.strip(b'-0123456789')
+
+        if hasattr(items, 'tolist'):
+            # Iterate NumPy arrays as native Python values.
+            items = items.tolist()
+
+        for item in items:
+            if type(item) is int:
+                if item and intsafe:
+                    yield head + str(item).encode('ascii') + tail
+                    continue
+            elif type(item) is bytes:
+                if item and item == item.strip(delimiter):
+                    yield head + item + tail
+                    continue
+
+            yield self(item).__getpathway__()
+
     def __preparestate__(self, *paths, **params):
-        """Join paths with our delimiter."""
-        state = self.__getstate__()
-        state['pathway'] = delimitedpathjoin(state['delimiter'],
-                                             state['pathway'],
-                                             *paths)
+        """Extend our segments with paths."""
+        (leading,
+         segments,
+         trailing) = joinsegments(self.__delimiter__,
+                                  pathsegments(paths, bytes, bytessegment),
+                                  self.__segmentstate__)
 
-        return state
+        return {'__leading__': leading,
+                '__segments__': segments,
+                '__trailing__': trailing}
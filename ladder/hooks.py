@@ -0,0 +1,192 @@
+"""Hooks called around API requests.
+"""
+
+import re
+from collections import Counter, namedtuple
+from threading import Lock
+
+from . import _compat
+from ._compat import iteritems, timer
+
+
+RouteSummary = namedtuple('RouteSummary', ['count',
+                                           'errors',
+                                           'total',
+                                           'mean',
+                                           'min',
+                                           'max',
+                                           'statuses'])
+
+UUID_RE = re.compile('^[0-9a-f]{8}-?([0-9a-f]{4}-?){3}[0-9a-f]{12}$',
+                     re.IGNORECASE)
+
+
+class Hook(object):
+    """Base class of request hooks. Subclasses override `before` and/or
+    `after`, which are called with the same `Call` before and after each
+    request made by an ``API`` configured with the hook.
+    """
+    def before(self, call):
+        """Called with `call` before the request is made."""
+        pass
+
+    def after(self, call):
+        """Called with `call` after the request has returned or raised."""
+        pass
+
+
+class Call(object):
+    """Record of a single request passed to hooks. Once finished, `elapsed`
+    holds the duration in seconds and either `response` or `exception` is
+    set.
+    """
+    __slots__ = ('path',
+                 'method',
+                 'url',
+                 'args',
+                 'kargs',
+                 'started',
+                 'elapsed',
+                 'response',
+                 'exception')
+
+    def __init__(self, path, method, url, args, kargs):
+        self.path = path
+        self.method = method
+        self.url = url
+        self.args = args
+        self.kargs = kargs
+        self.started = None
+        self.elapsed = None
+        self.response = None
+        self.exception = None
+
+    def start(self, hooks):
+        """Call each hook's ``before`` and start timing."""
+        for hook in hooks:
+            hook.before(self)
+
+        self.started = timer()
+
+    def finish(self, hooks, response=None, exception=None):
+        """Stop timing, record the outcome and call each hook's ``after`` in
+        reverse order.
+        """
+        self.elapsed = timer() - self.started
+        self.response = response
+        self.exception = exception
+
+        for hook in reversed(hooks):
+            hook.after(self)
+
+
+class RouteStats(Hook):
+    """Hook which aggregates latency, status and error counts per HTTP method
+    and normalized route so that ``/users/123`` and ``/users/456`` are
+    counted together as ``/users/{id}``. Thread-safe.
+
+    Args:
+        normalize (callable, optional): Function which returns the route of a
+            URL. Defaults to `normalizeroute`.
+        status (callable, optional): Function which returns the status code of
+            a response. Defaults to `responsestatus`.
+    """
+    def __init__(self, normalize=None, status=None):
+        self.normalize = normalize or normalizeroute
+        self.status = status or responsestatus
+        self._routes = {}
+        self._lock = Lock()
+
+    def __reduce__(self):
+        # Recorded stats aren't pickled so unpickling gives empty stats.
+        return (RouteStats, (self.normalize, self.status))
+
+    def after(self, call):
+        key = (call.method.upper(), self.normalize(call.url))
+        status = (None if call.response is None
+                  else self.status(call.response))
+
+        with self._lock:
+            stats = self._routes.get(key)
+
+            if stats is None:
+                stats = self._routes[key] = [0, 0, 0.0, None, None, Counter()]
+
+            stats[0] += 1
+            stats[2] += call.elapsed
+
+            if call.exception is not None:
+                stats[1] += 1
+
+            if stats[3] is None or call.elapsed < stats[3]:
+                stats[3] = call.elapsed
+
+            if stats[4] is None or call.elapsed > stats[4]:
+                stats[4] = call.elapsed
+
+            if status is not None:
+                stats[5][status] += 1
+
+    def snapshot(self):
+        """Return dict of `RouteSummary` keyed by ``(method, route)``."""
+        with self._lock:
+            return dict((key, summarize([stats]))
+                        for key, stats in iteritems(self._routes))
+
+    def aggregate(self):
+        """Return `RouteSummary` across all routes."""
+        with self._lock:
+            return summarize(list(self._routes.values()))
+
+    def reset(self):
+        """Discard all recorded stats."""
+        with self._lock:
+            self._routes.clear()
+
+
+def summarize(routes):
+    """Return `RouteSummary` combining the stats lists of `routes`."""
+    count = sum(stats[0] for stats in routes)
+    total = sum(stats[2] for stats in routes)
+    minimums = [stats[3] for stats in routes if stats[3] is not None]
+    maximums = [stats[4] for stats in routes if stats[4] is not None]
+    statuses = Counter()
+
+    for stats in routes:
+        statuses.update(stats[5])
+
+    return RouteSummary(count,
+                        sum(stats[1] for stats in routes),
+                        total,
+                        total / count if count else 0.0,
+                        min(minimums) if minimums else None,
+                        max(maximums) if maximums else None,
+                        dict(statuses))
+
+
+def normalizeroute(url):
+    """Return path of `url` with numeric and UUID segments replaced by
+    ``{id}`` placeholders.
+    """
+    path = _compat.urlsplit(url).path
+    return '/'.join(normalizesegment(segment)
+                    for segment in path.split('/')) or '/'
+
+
+def normalizesegment(segment):
+    """Return ``{id}`` if `segment` is numeric or a UUID or else `segment`."""
+    if segment.isdigit() or UUID_RE.match(segment):
+        return '{id}'
+    return segment
+
+
+def responsestatus(response):
+    """Return status code of `response` from either its ``status_code``
+    (Requests) or ``status`` (aiohttp) attribute.
+    """
+    status = getattr(response, 'status_code', None)
+
+    if status is None:
+        status = getattr(response, 'status', None)
+
+    return status
@@ -1,7 +1,16 @@
 """Generic interface for path generation.
 """
 
-from .utils import require_override
+from itertools import product
+
+from .cache import childkey
+from .utils import chunked, require_override
+from ._compat import iteritems, text_type
+
+
+# Placeholder segment used to split a rendered child path into the parts
+# shared by every child when expanding paths. See __iterproduct__().
+EXPAND_MARKER = '\x00'
 
 
 class Ladder(object):
@@ -12,15 +21,32 @@ class Ladder(object):
     as a super class.
     """
 
-    # Define our state attributes which correspond to the argument names of
-    # the __init__() function. These attributes (minus the leading and trailing
-    # "__") will be passed to subsequent generative calls.
-    __attrs__ = ['__pathway__']
+    # Define our state attributes. These attributes make up the immutable
+    # state of an instance and are carried over to subsequent generative calls
+    # where they are shared with the next generation instead of being rebuilt.
+    # Subclasses should declare a slot for each attribute they add.
+    __attrs__ = []
+
+    # Instances are stored compactly without a __dict__ since every generative
+    # call creates one. __pathway__ caches the rendered path string and
+    # __hashcode__ our hash. They're not part of our state so they're never
+    # carried over to the next generation. __cache__ is an optional cache of
+    # generated children (see ladder.cache.cached()) which is shared with
+    # every generation.
+    __slots__ = ('__pathway__', '__hashcode__', '__cache__')
 
-    # You are required to override this method. Parameters defined in __attrs__
-    # will be passed to this function via **argument unpacking in __call__().
+    # Type of rendered paths and of the path segments they're made of.
+    __pathtype__ = text_type
+
+    def __new__(cls, *args, **kargs):
+        obj = super(Ladder, cls).__new__(cls)
+        obj.__cache__ = None
+        return obj
+
+    # You are required to override this method. It's only used to create the
+    # first generation; subsequent generations are created by __spawn__().
     # WARNING: Inside this function, the class instance attributes in __attrs__
-    # should be assigned. If they are not, then a recursion error will result
+    # should be assigned. If they are not, then an AttributeError will result
     # during the generative call.
     @require_override
     def __init__(self, pathway=None, **params):  # pragma: no cover
@@ -43,34 +69,245 @@ class Ladder(object):
     __rdiv__ = __radd__
     __rtruediv__ = __radd__
 
+    def __eq__(self, other):
+        if self is other:
+            return True
+
+        if not isinstance(other, Ladder):
+            return NotImplemented
+
+        # Hashes are cached so they're compared first.
+        return (type(self) is type(other) and
+                hash(self) == hash(other) and
+                self.__statekey__() == other.__statekey__())
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    def __hash__(self):
+        """Return hash of our class and state. Since instances are immutable,
+        it's only computed once.
+        """
+        try:
+            return self.__hashcode__
+        except AttributeError:
+            self.__hashcode__ = hash((type(self), self.__statekey__()))
+            return self.__hashcode__
+
+    def __statekey__(self):
+        """Return tuple of the values which identify our path: the rendered
+        path plus any state which only affects the paths generated from us.
+        Instances of the same class with equal state keys are equal. Override
+        to add such state.
+        """
+        return (self.__getpathway__(),)
+
     def __getstate__(self):
-        """Return self.__attrs__ resolved onto self with leading/trailing `__`
-        removed. This is used to propagate init args to next class generation.
+        """Return self.__attrs__ resolved onto self. This is used to propagate
+        state to next class generation.
         """
-        state = dict((attr.replace('__', ''), getattr(self, attr, None))
+        state = dict((attr, getattr(self, attr, None))
                      for attr in self.__attrs__)
 
         return state
 
+    def __setstate__(self, state):
+        """Assign state attributes returned from `__getstate__`."""
+        for attr, value in iteritems(state):
+            setattr(self, attr, value)
+
+    def __reduce__(self):
+        """Return compact pickle of our state attribute values in `__attrs__`
+        order along with our cache, if any. The rendered path isn't included.
+        """
+        values = tuple(getattr(self, attr) for attr in self.__attrs__)
+
+        if self.__cache__ is None:
+            return (restoreladder, (self.__class__, values))
+        return (restoreladder, (self.__class__, values, self.__cache__))
+
     def __getattr__(self, path):
         """Treat attribute access as path concatenation."""
+        if path.startswith('__') and path.endswith('__'):
+            # Special attributes are never paths. This is also how unset slots
+            # and protocol lookups (e.g. __deepcopy__) fail as expected.
+            raise AttributeError(path)
         return self(path)
 
     def __getpathway__(self):
-        """Return current object as string."""
-        return self.__pathway__
+        """Return current object as string. Since instances are immutable, the
+        string is only rendered once.
+        """
+        try:
+            return self.__pathway__
+        except AttributeError:
+            self.__pathway__ = self.__renderpathway__()
+            return self.__pathway__
+
+    @require_override
+    def __renderpathway__(self):  # pragma: no cover
+        """Render current object as string."""
+        pass
 
     @require_override
     def __preparestate__(self, *paths, **params):  # pragma: no cover
-        """Given paths and params prepare arguments for call to
-        class(**state).
+        """Given paths and params prepare the state attributes which differ
+        between our self and the "next" class instance.
 
-        Generally, you will want to call self.__getstate__() and mutate the
-        data in some way to get to the "next" class instance.
+        Only the changed attributes need to be returned. Everything else in
+        __attrs__ is carried over by __spawn__() as is.
         """
         pass
 
+    def __spawn__(self, state):
+        """Return a new class instance with our state updated by `state`.
+        Bypasses __init__() since our state is already normalized.
+        """
+        cls = self.__class__
+        obj = cls.__new__(cls)
+
+        for attr in self.__attrs__:
+            setattr(obj, attr, getattr(self, attr))
+
+        obj.__setstate__(state)
+        obj.__cache__ = self.__cache__
+        return obj
+
+    def __tosegment__(self, item):
+        """Return `item` converted to our `__pathtype__`."""
+        return item if isinstance(item, text_type) else text_type(item)
+
+    def __issegment__(self, path):
+        """Return whether text `path` is added to our path as a single segment
+        without any normalization. Override to allow fast path expansion.
+        """
+        return False
+
+    def __iterexpand__(self, items):
+        """Return iterator of rendered child paths generated by calling our
+        self with each item in `items`. See __iterproduct__().
+        """
+        return self.__iterproduct__(items)
+
+    def __iterproduct__(self, *iterables, **kargs):
+        """Return iterator of rendered child paths generated by calling our
+        self with every combination of one item from each of `iterables`, e.g.
+        ``path(region, date)`` for each region and date. The path parts common
+        to every child are rendered once so only the items themselves are
+        rendered per child unless an item needs to be normalized. Paths are
+        generated lazily without creating intermediate class instances.
+
+        Pass `chunksize` to iterate lists of up to `chunksize` paths instead.
+        """
+        chunksize = kargs.pop('chunksize', None)
+
+        if kargs:
+            raise TypeError('Unexpected keyword arguments: {0}'
+                            .format(', '.join(sorted(kargs))))
+
+        paths = self.__productpaths__(iterables)
+
+        return chunked(paths, chunksize) if chunksize else paths
+
+    def __productpaths__(self, iterables):
+        """Generate rendered child paths for __iterproduct__()."""
+        marker, percent, placeholder = (self.__tosegment__(text)
+                                        for text in (EXPAND_MARKER, '%', '%s'))
+        # Bypass any children cache since the markers are throwaway.
+        markers = [marker] * len(iterables)
+        parts = (self.__spawn__(self.__preparestate__(*markers))
+                 .__getpathway__()
+                 .split(marker))
+        template = placeholder.join(part.replace(percent, percent * 2)
+                                    for part in parts)
+        plain = len(parts) == len(iterables) + 1
+        tosegment = self.__tosegment__
+        issegment = self.__issegment__
+        pools = []
+
+        for items in iterables:
+            if hasattr(items, 'tolist'):
+                # Iterate NumPy arrays as native Python values.
+                items = items.tolist()
+
+            pool = []
+
+            for item in items:
+                path = tosegment(item)
+
+                if not (item and not isinstance(item, (list, tuple)) and
+                        issegment(path)):
+                    # Needs to be normalized by a generative call.
+                    path = None
+                    plain = False
+
+                pool.append((item, path))
+
+            pools.append(pool)
+
+        if plain and len(pools) == 1:
+            # Concatenating is faster than formatting a single path.
+            head, tail = parts
+            for _, path in pools[0]:
+                yield head + path + tail
+            return
+
+        if plain:
+            for paths in product(*[[path for _, path in pool]
+                                   for pool in pools]):
+                yield template % paths
+            return
+
+        for combination in product(*pools):
+            paths = tuple(path for _, path in combination)
+
+            if len(parts) == len(paths) + 1 and None not in paths:
+                yield template % paths
+            else:
+                yield self(*[item for item, _ in
+                             combination]).__getpathway__()
+
+    def __expand__(self, items, numpy=False):
+        """Return list of rendered child paths generated by calling our self
+        with each item in `items`. See __iterexpand__(). If `numpy`, then
+        return a NumPy string (or bytes) array instead (requires NumPy).
+        """
+        paths = list(self.__iterexpand__(items))
+
+        if numpy:
+            import numpy as np
+            paths = np.array(paths, dtype=self.__pathtype__)
+
+        return paths
+
     def __call__(self, *paths, **params):
-        """Generate a new class instance from our self."""
-        state = self.__preparestate__(*paths, **params)
-        return self.__class__(**state)
+        """Generate a new class instance from our self. If we have a cache,
+        then a previously generated instance may be returned instead.
+        """
+        cache = self.__cache__
+        key = None if cache is None else childkey(self, paths, params)
+
+        if key is None:
+            return self.__spawn__(self.__preparestate__(*paths, **params))
+
+        child = cache.get(key)
+
+        if child is None:
+            child = self.__spawn__(self.__preparestate__(*paths, **params))
+            cache.set(key, child)
+
+        return child
+
+
+def restoreladder(cls, values, cache=None):
+    """Return unpickled instance of Ladder subclass `cls` with state attribute
+    `values` given in ``cls.__attrs__`` order.
+    """
+    obj = cls.__new__(cls)
+
+    for attr, value in zip(cls.__attrs__, values):
+        setattr(obj, attr, value)
+
+    obj.__cache__ = cache
+    return obj
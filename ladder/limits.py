@@ -0,0 +1,157 @@
+"""Client-side rate and concurrency limits for API requests.
+"""
+
+import time
+from threading import Condition, Lock
+
+from .hooks import responsestatus
+from ._compat import timer
+
+
+class TokenBucket(object):
+    """Thread-safe token bucket which allows `rate` requests per second on
+    average with bursts of up to `burst` requests.
+    """
+    def __init__(self, rate, burst=1):
+        self.rate = float(rate)
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = timer()
+        self._lock = Lock()
+
+    def __reduce__(self):
+        return (TokenBucket, (self.rate, self.burst))
+
+    def reserve(self, tokens=1):
+        """Take `tokens` from the bucket and return the number of seconds to
+        wait before they're available. The tokens are reserved either way.
+        """
+        with self._lock:
+            now = timer()
+            self.tokens = min(self.burst,
+                              self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= tokens
+
+            return max(0.0, -self.tokens / self.rate)
+
+    def acquire(self, tokens=1):
+        """Take `tokens` from the bucket, sleeping until they're available."""
+        delay = self.reserve(tokens)
+
+        if delay:
+            time.sleep(delay)
+
+
+class AdaptiveConcurrency(object):
+    """Thread-safe limit on the number of concurrent requests which adapts to
+    how the server copes with them. The limit starts at `initial` and stays
+    between `minimum` and `maximum`.
+
+    Responses with one of `statuses` (e.g. ``429 Too Many Requests``) reduce
+    the limit by the `backoff` factor, at most once for the requests that
+    were in flight at the time. Other responses which take no longer than
+    `latency` seconds, or any other responses if `latency` isn't given,
+    increase the limit by about one for every limit's worth of responses.
+    Using the same minimum and maximum gives a fixed limit.
+    """
+    def __init__(self, initial=4, minimum=1, maximum=64, latency=None,
+                 backoff=0.5, statuses=(429, 503)):
+        self.limit = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.latency = latency
+        self.backoff = backoff
+        self.statuses = frozenset(statuses)
+        self.active = 0
+        self.decreased = None
+        self._condition = Condition(Lock())
+
+    def __reduce__(self):
+        return (AdaptiveConcurrency, (self.limit,
+                                      self.minimum,
+                                      self.maximum,
+                                      self.latency,
+                                      self.backoff,
+                                      tuple(self.statuses)))
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.release()
+
+    @property
+    def capacity(self):
+        """Return current number of concurrent requests allowed."""
+        return max(1, int(self.limit))
+
+    def acquire(self):
+        """Wait until a request is allowed and count it as active."""
+        with self._condition:
+            while self.active >= self.capacity:
+                self._condition.wait()
+            self.active += 1
+
+    def release(self):
+        """Count an active request as finished."""
+        with self._condition:
+            self.active -= 1
+            self._condition.notify_all()
+
+    def record(self, status, started, elapsed, failed=False):
+        """Adapt the limit to a request started at `started` (a ``timer()``
+        value) which took `elapsed` seconds and got a response with `status`.
+        A request which `failed` only ever decreases the limit.
+        """
+        with self._condition:
+            if status in self.statuses:
+                # Requests started before the last decrease were sent under
+                # the previous limit so they don't decrease it again.
+                if self.decreased is None or started >= self.decreased:
+                    self.limit = max(self.minimum, self.limit * self.backoff)
+                    self.decreased = timer()
+            elif not failed and (self.latency is None or
+                                 elapsed <= self.latency):
+                self.limit = min(self.maximum, self.limit + 1.0 / self.limit)
+
+            self._condition.notify_all()
+
+
+def adaptiveconcurrency(concurrency):
+    """Return `AdaptiveConcurrency` for `concurrency`, which may be one
+    already, a fixed limit or ``None`` for no limit.
+    """
+    if concurrency is None or isinstance(concurrency, AdaptiveConcurrency):
+        return concurrency
+    return AdaptiveConcurrency(concurrency, concurrency, concurrency)
+
+
+def recordcall(concurrency, call):
+    """Adapt `concurrency` (e.g. an `AdaptiveConcurrency`) to the finished
+    request of hooks ``Call`` `call`. A `concurrency` of ``None`` is ignored.
+    """
+    if concurrency is None:
+        return
+
+    if call.exception is None:
+        concurrency.record(responsestatus(call.response),
+                           call.started,
+                           call.elapsed)
+    else:
+        concurrency.record(
+            responsestatus(getattr(call.exception, 'response', None)),
+            call.started,
+            call.elapsed,
+            failed=True)
+
+
+def ratebucket(rate_limit, netloc):
+    """Return the `TokenBucket` of `rate_limit` for requests to `netloc`.
+    `rate_limit` may be a `TokenBucket` for all requests or a dict of them
+    keyed by netloc.
+    """
+    if isinstance(rate_limit, dict):
+        return rate_limit.get(netloc)
+    return rate_limit
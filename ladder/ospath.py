@@ -1,21 +1,34 @@
 """OS path generation.
 """
 
+import os
+
 from .ladder import Ladder
-from .utils import ospathjoin
+from .utils import pathsegments
 
 
 class OSPath(Ladder):
     """Generate os.path strings using Ladder interface."""
 
-    __attrs__ = ['__pathway__']
+    __attrs__ = ['__segments__']
+    __slots__ = tuple(__attrs__)
 
     def __init__(self, pathway=None):
-        self.__pathway__ = ospathjoin(pathway)
+        self.__segments__ = tuple(pathsegments((pathway,)))
 
-    def __preparestate__(self, *paths, **params):
-        """Join paths using os.path."""
-        state = self.__getstate__()
-        state['pathway'] = ospathjoin(state['pathway'], *paths)
+    def __issegment__(self, path):
+        """Return whether `path` is added to our path as is. Paths ending in
+        a separator aren't since joining another path to them doesn't add
+        one.
+        """
+        return not (os.path.isabs(path) or os.path.splitdrive(path)[0] or
+                    path.endswith(os.sep) or
+                    (os.altsep and path.endswith(os.altsep)))
 
-        return state
+    def __renderpathway__(self):
+        """Join path segments using os.path."""
+        return os.path.join(*self.__segments__) if self.__segments__ else ''
+
+    def __preparestate__(self, *paths, **params):
+        """Extend our segments with paths."""
+        return {'__segments__': self.__segments__ + tuple(pathsegments(paths))}
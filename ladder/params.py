@@ -0,0 +1,265 @@
+"""Persistent ordered multidict of URL query params.
+"""
+
+from .cache import LRUCache
+from . import _compat
+
+
+EMPTY_KEYS = frozenset()
+
+# Cache of URL encoded query params keyed by their key and value.
+ENCODED_PARAMS = LRUCache(maxsize=1024)
+
+
+class Params(object):
+    """Immutable ordered multidict of ``(key, value)`` query params. Every
+    change returns a new `Params` which shares its parent's pairs instead of
+    copying them, so layering params over many generations only stores the
+    pairs added by each generation.
+
+    Each generation holds the pairs it places before and after its parent's
+    pairs along with the keys it removes from its parent. The flat sequence of
+    pairs is assembled once, on first iteration, and kept. Likewise, the
+    encoded query string is kept once built and extended by later generations
+    which only encode the pairs they add.
+    """
+    __slots__ = ('_parent', '_prefix', '_pairs', '_drop', '_items', '_query')
+
+    def __init__(self, pairs=()):
+        self._parent = None
+        self._prefix = ()
+        self._pairs = tuple(pairs)
+        self._drop = EMPTY_KEYS
+        self._items = self._pairs
+        self._query = None
+
+    def _derive(self, prefix=(), pairs=(), drop=()):
+        """Return new generation of params with `prefix` pairs before ours
+        minus the `drop` keys followed by `pairs`.
+        """
+        params = Params.__new__(Params)
+        params._parent = self
+        params._prefix = prefix
+        params._pairs = pairs
+        params._drop = frozenset(drop) if drop else EMPTY_KEYS
+        params._items = None
+        params._query = None
+
+        return params
+
+    def _lineage(self, key=None):
+        """Return list of generations from ourself back to the root or, given
+        `key`, back to the first generation which removes `key` from its
+        parent.
+        """
+        lineage = []
+        params = self
+
+        while params is not None:
+            lineage.append(params)
+
+            if params._items is not None or key in params._drop:
+                break
+
+            params = params._parent
+
+        return lineage
+
+    def append(self, key, value):
+        """Return params with `key` and `value` added last."""
+        return self._derive(pairs=((key, value),))
+
+    def extend(self, pairs):
+        """Return params with `pairs` added last."""
+        pairs = tuple(pairs)
+        return self._derive(pairs=pairs) if pairs else self
+
+    def prepend(self, pairs):
+        """Return params with `pairs` added first."""
+        pairs = tuple(pairs)
+        return self._derive(prefix=pairs) if pairs else self
+
+    def replace(self, key, values):
+        """Return params with all pairs for `key` removed and then `values`
+        added last. `values` may be a single value or a list or tuple of
+        values.
+        """
+        if not isinstance(values, (list, tuple)):
+            values = (values,)
+
+        return self._derive(pairs=tuple((key, value) for value in values),
+                            drop=(key,))
+
+    def remove(self, *keys):
+        """Return params with all pairs for `keys` removed."""
+        keys = [key for key in keys if key in self]
+        return self._derive(drop=keys) if keys else self
+
+    def getall(self, key):
+        """Return tuple of all values for `key` in order."""
+        lineage = self._lineage(key)
+        last = lineage[-1]
+
+        if last._items is not None:
+            # The flat pairs already account for all older generations.
+            middle = [value for name, value in last._items if name == key]
+            lineage.pop()
+        else:
+            middle = []
+
+        head = [value
+                for params in lineage
+                for name, value in params._prefix
+                if name == key]
+        tail = [value
+                for params in reversed(lineage)
+                for name, value in params._pairs
+                if name == key]
+
+        return tuple(head + middle + tail)
+
+    def get(self, key, default=None):
+        """Return first value for `key` or `default` if there isn't one."""
+        values = self.getall(key)
+        return values[0] if values else default
+
+    def keys(self):
+        """Return list of unique keys in order."""
+        keys = []
+        seen = set()
+
+        for key, _ in self:
+            if key not in seen:
+                seen.add(key)
+                keys.append(key)
+
+        return keys
+
+    def encode(self):
+        """Return params as URL encoded query string. Only the generations
+        since the closest one with a kept query string are encoded.
+        """
+        if self._query is None:
+            heads = []
+            tails = []
+            middle = ''
+            params = self
+
+            while params is not None:
+                if params._query is not None:
+                    middle = params._query
+                    break
+
+                heads.append(encodepairs(params._prefix))
+                tails.append(encodepairs(params._pairs))
+
+                if params._drop:
+                    middle = encodepairs(pair for pair in params._parent
+                                         if pair[0] not in params._drop)
+                    break
+
+                params = params._parent
+
+            self._query = '&'.join(query
+                                   for query in heads + [middle] + tails[::-1]
+                                   if query)
+
+        return self._query
+
+    def __iter__(self):
+        if self._items is None:
+            self._items = self._flatten()
+        return iter(self._items)
+
+    def _flatten(self):
+        """Return tuple of all pairs in order."""
+        heads = []
+        tails = []
+        dropped = EMPTY_KEYS
+        params = self
+
+        while params is not None:
+            if params._items is not None:
+                tails.append([pair for pair in params._items
+                              if pair[0] not in dropped])
+                break
+
+            heads.append([pair for pair in params._prefix
+                          if pair[0] not in dropped])
+            tails.append([pair for pair in params._pairs
+                          if pair[0] not in dropped])
+            dropped = dropped.union(params._drop)
+            params = params._parent
+
+        items = []
+
+        for pairs in heads:
+            items.extend(pairs)
+
+        for pairs in reversed(tails):
+            items.extend(pairs)
+
+        return tuple(items)
+
+    def __len__(self):
+        if self._items is None:
+            self._items = self._flatten()
+        return len(self._items)
+
+    def __bool__(self):
+        return len(self) > 0
+
+    __nonzero__ = __bool__
+
+    def __contains__(self, key):
+        return bool(self.getall(key))
+
+    def __eq__(self, other):
+        if isinstance(other, (Params, list)):
+            other = tuple(other)
+        elif not isinstance(other, tuple):
+            return NotImplemented
+
+        return tuple(self) == other
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    def __hash__(self):
+        return hash(tuple(self))
+
+    def __repr__(self):
+        return '{0}({1!r})'.format(type(self).__name__, list(self))
+
+    def __reduce__(self):
+        return (Params, (tuple(self),))
+
+
+def encodepairs(pairs):
+    """Return URL encoded query string of `pairs` like ``urlencode`` but
+    with the encoding of each pair served from a bounded cache.
+    """
+    return '&'.join(encodepair(key, value) for key, value in pairs)
+
+
+def encodepair(key, value):
+    """Return URL encoded ``key=value`` query param. Encodings of hashable
+    params are cached. Types are part of the cache key since, e.g., ``1`` and
+    ``True`` are equal but encoded differently.
+    """
+    cachekey = (type(key), key, type(value), value)
+
+    try:
+        encoded = ENCODED_PARAMS.get(cachekey)
+    except TypeError:
+        return _compat.urlencode(((key, value),))
+
+    if encoded is None:
+        encoded = _compat.urlencode(((key, value),))
+        ENCODED_PARAMS.set(cachekey, encoded)
+
+    return encoded
+
+
+EMPTY_PARAMS = Params()
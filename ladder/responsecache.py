@@ -0,0 +1,189 @@
+"""Caching of API responses.
+"""
+
+from .cache import LRUCache
+from .hooks import responsestatus
+from .params import encodepairs
+from ._compat import iteritems, text_type, timer
+
+
+# HTTP methods whose responses are cached.
+CACHEABLE_METHODS = frozenset(['head', 'get', 'options'])
+
+
+class ResponseCache(object):
+    """Cache of responses to idempotent ``API`` requests (see
+    `CACHEABLE_METHODS`) keyed by `requestkey`, i.e. by their canonical URL
+    and call arguments. The least recently used responses are evicted once
+    more than `maxsize` are cached and responses are stale `ttl` seconds after
+    being cached. A `ttl` of ``None`` never expires responses.
+
+    A stale response whose ``headers`` include an ``ETag`` or
+    ``Last-Modified`` value is revalidated by sending the request with
+    ``If-None-Match`` or ``If-Modified-Since`` headers. A ``304`` status keeps
+    the cached response for another `ttl` seconds. Only responses without a
+    status or with a 2xx status are cached.
+    """
+    def __init__(self, maxsize=128, ttl=60):
+        self.ttl = ttl
+        self.entries = LRUCache(maxsize)
+
+    def __reduce__(self):
+        return (ResponseCache, (self.entries.maxsize, self.ttl))
+
+    def info(self):
+        """Return cache statistics as ``CacheInfo``."""
+        return self.entries.info()
+
+    def clear(self):
+        """Remove all cached responses."""
+        self.entries.clear()
+
+    def lookup(self, key):
+        """Return `CacheEntry` for `key` or ``None`` if not cached."""
+        return None if key is None else self.entries.get(key)
+
+    def update(self, key, entry, response):
+        """Cache `response` for `key` and return the response to use, which is
+        the response of `entry` if `response` is a ``304``.
+        """
+        if key is None:
+            return response
+
+        status = responsestatus(response)
+
+        if entry is not None and status == 304:
+            entry.expires = self.expiry()
+            return entry.response
+
+        if status is None or 200 <= status < 300:
+            self.entries.set(key, CacheEntry(response,
+                                             self.expiry(),
+                                             responseheader(response, 'ETag'),
+                                             responseheader(response,
+                                                            'Last-Modified')))
+
+        return response
+
+    def prepare(self, key, kargs):
+        """Return ``(entry, kargs)`` of the `CacheEntry` for `key`, if any,
+        and the request `kargs` with the headers needed to revalidate it. The
+        `kargs` are ``None`` if the cached response is fresh. Pass the
+        response of the request to `update`.
+        """
+        entry = self.lookup(key)
+
+        if entry is not None and entry.isfresh():
+            return (entry, None)
+
+        return (entry, conditional(entry, kargs))
+
+    def fetch(self, key, request, *args, **kargs):
+        """Return cached response for `key` or call ``request(*args, **kargs)``
+        to get, revalidate and cache it.
+        """
+        entry, kargs = self.prepare(key, kargs)
+
+        if kargs is None:
+            return entry.response
+
+        return self.update(key, entry, request(*args, **kargs))
+
+    def expiry(self):
+        """Return time at which a response cached now becomes stale."""
+        return None if self.ttl is None else timer() + self.ttl
+
+
+class CacheEntry(object):
+    """Cached response along with its expiry time and validators."""
+    __slots__ = ('response', 'expires', 'etag', 'modified')
+
+    def __init__(self, response, expires, etag=None, modified=None):
+        self.response = response
+        self.expires = expires
+        self.etag = etag
+        self.modified = modified
+
+    def isfresh(self):
+        """Return whether the response hasn't expired."""
+        return self.expires is None or timer() < self.expires
+
+
+def requestkey(path, method, args, kargs):
+    """Return key identifying a call of `method` on URL `path` with `args`
+    and `kargs` or ``None`` if the call isn't one of `CACHEABLE_METHODS` or
+    has unhashable arguments. Query params are sorted by name so their order
+    doesn't matter.
+    """
+    if method not in CACHEABLE_METHODS:
+        return None
+
+    scheme, netloc, pathway, _, _ = path.__urlsplit__
+
+    if netloc and not pathway.startswith('/'):
+        pathway = '/' + pathway
+
+    query = encodepairs(sorted(path.__params__,
+                               key=lambda pair: text_type(pair[0])))
+
+    try:
+        key = (method,
+               scheme.lower(),
+               netloc.lower(),
+               pathway,
+               query,
+               freeze(args),
+               freeze(kargs))
+        hash(key)
+    except TypeError:
+        # Unhashable or unsortable arguments.
+        return None
+
+    return key
+
+
+def conditional(entry, kargs):
+    """Return request `kargs` with conditional request headers for revalidating
+    the response of `entry`, if it has any validators.
+    """
+    if entry is None or not (entry.etag or entry.modified):
+        return kargs
+
+    headers = dict(kargs.get('headers') or {})
+
+    if entry.etag:
+        headers['If-None-Match'] = entry.etag
+
+    if entry.modified:
+        headers['If-Modified-Since'] = entry.modified
+
+    return dict(kargs, headers=headers)
+
+
+def responseheader(response, name):
+    """Return header `name` of `response` or ``None`` if it doesn't have the
+    header or any headers.
+    """
+    headers = getattr(response, 'headers', None)
+
+    if headers is None:
+        return None
+
+    # Response header mappings of HTTP clients are case-insensitive but a
+    # plain dict isn't.
+    return headers.get(name) or headers.get(name.lower())
+
+
+def freeze(value):
+    """Return hashable copy of `value` with dicts replaced by tuples of their
+    sorted items, lists by tuples and sets by frozensets.
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((key, freeze(item))
+                            for key, item in iteritems(value)))
+    elif isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    elif isinstance(value, (set, frozenset)):
+        return frozenset(freeze(item) for item in value)
+
+    return value
@@ -0,0 +1,147 @@
+"""Matching of paths against route templates.
+"""
+
+import re
+from collections import OrderedDict, namedtuple
+from string import Formatter
+
+from .ladder import Ladder
+from .template import RouteTemplate
+from .urlpath import splitorigin
+
+
+RouteMatch = namedtuple('RouteMatch', ['route', 'value', 'params'])
+
+
+class RouteIndex(object):
+    """Index of route templates stored as a trie of path segments. Templates
+    are ``URLPath``, ``DelimitedPath`` or `RouteTemplate` instances or strings
+    whose segments may contain ``str.format`` placeholders, e.g.
+    ``/users/{user_id}`` or ``/files/{name}.{ext}``.
+
+    Matching a path walks the trie one segment at a time so it takes time
+    proportional to the number of segments in the path instead of the number
+    of routes. Literal segments take precedence over segments with
+    placeholders, which take precedence over segments which are only a
+    placeholder.
+
+    Leading, trailing and repeated delimiters are ignored. With the default
+    ``/`` delimiter, the scheme, netloc, query string and fragment of templates
+    and paths are ignored too. Placeholder values are returned as found in the
+    path without any percent-decoding.
+    """
+    def __init__(self, routes=(), delimiter='/'):
+        self.delimiter = delimiter
+        self.root = TrieNode()
+        self.count = 0
+
+        for route in routes:
+            self.add(route)
+
+    def __len__(self):
+        return self.count
+
+    def splitpath(self, path):
+        """Return list of non-empty segments of `path`."""
+        if isinstance(path, RouteTemplate):
+            path = path.pathway
+        elif isinstance(path, Ladder):
+            path = path.__getpathway__()
+
+        if self.delimiter == '/':
+            _, _, path = splitorigin(path)
+            path = path.partition('#')[0].partition('?')[0]
+
+        return [segment for segment in path.split(self.delimiter) if segment]
+
+    def add(self, route, value=None):
+        """Add `route` template to the index. Its match returns `value` or, if
+        not given, `route`. Adding a template with the same segments as an
+        existing one replaces it.
+        """
+        node = self.root
+        names = []
+        position = 0
+
+        for segment in self.splitpath(route):
+            parts = list(Formatter().parse(segment))
+            fields = [field for _, field, _, _ in parts if field is not None]
+
+            if not fields:
+                literal = ''.join(literal for literal, _, _, _ in parts)
+                node = node.literals.setdefault(literal, TrieNode())
+                continue
+
+            for field in fields:
+                if not field:
+                    # Automatically numbered positional placeholder.
+                    field = str(position)
+                    position += 1
+                names.append(field)
+
+            if len(parts) == 1 and not parts[0][0]:
+                if node.wildcard is None:
+                    node.wildcard = TrieNode()
+                node = node.wildcard
+            else:
+                pattern = ''.join(re.escape(literal) +
+                                  ('' if field is None else '(.+?)')
+                                  for literal, field, _, _ in parts) + '$'
+
+                if pattern not in node.patterns:
+                    node.patterns[pattern] = (re.compile(pattern), TrieNode())
+
+                node = node.patterns[pattern][1]
+
+        if node.route is None:
+            self.count += 1
+
+        node.route = (route, route if value is None else value, tuple(names))
+
+    def match(self, path):
+        """Return `RouteMatch` of the route template matching `path` with a
+        dict of its placeholder values as ``params`` or ``None`` if no route
+        matches.
+        """
+        segments = self.splitpath(path)
+        stack = [(self.root, 0, ())]
+
+        while stack:
+            node, index, values = stack.pop()
+
+            if index == len(segments):
+                if node.route is not None:
+                    route, value, names = node.route
+                    return RouteMatch(route, value, dict(zip(names, values)))
+                continue
+
+            segment = segments[index]
+            index += 1
+
+            # Candidates are pushed in reverse order of precedence.
+            if node.wildcard is not None:
+                stack.append((node.wildcard, index, values + (segment,)))
+
+            for regex, child in reversed(list(node.patterns.values())):
+                found = regex.match(segment)
+
+                if found:
+                    stack.append((child, index, values + found.groups()))
+
+            child = node.literals.get(segment)
+
+            if child is not None:
+                stack.append((child, index, values))
+
+        return None
+
+
+class TrieNode(object):
+    """Segment trie node of `RouteIndex`."""
+    __slots__ = ('literals', 'patterns', 'wildcard', 'route')
+
+    def __init__(self):
+        self.literals = {}
+        self.patterns = OrderedDict()
+        self.wildcard = None
+        self.route = None
@@ -0,0 +1,64 @@
+"""Coalescing of identical concurrent calls.
+"""
+
+from threading import Event, Lock
+
+
+class SingleFlight(object):
+    """Group of keyed calls in which concurrent calls with the same key share
+    the result of the first one instead of each being made. Thread-safe.
+    """
+    def __init__(self):
+        self._flights = {}
+        self._lock = Lock()
+
+    def __reduce__(self):
+        return (SingleFlight, ())
+
+    def __len__(self):
+        return len(self._flights)
+
+    def do(self, key, func, *args, **kargs):
+        """Return ``func(*args, **kargs)`` unless a call with `key` is already
+        in flight, in which case wait for it and return its result or raise
+        its exception instead. A `key` of ``None`` is never coalesced.
+        """
+        if key is None:
+            return func(*args, **kargs)
+
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+
+            if leader:
+                flight = self._flights[key] = Flight()
+
+        if not leader:
+            flight.done.wait()
+
+            if flight.exception is not None:
+                raise flight.exception
+            return flight.result
+
+        try:
+            flight.result = func(*args, **kargs)
+        except BaseException as exc:
+            flight.exception = exc
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+
+            flight.done.set()
+
+        return flight.result
+
+
+class Flight(object):
+    """Call in flight of `SingleFlight`."""
+    __slots__ = ('done', 'result', 'exception')
+
+    def __init__(self):
+        self.done = Event()
+        self.result = None
+        self.exception = None
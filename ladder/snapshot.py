@@ -0,0 +1,306 @@
+"""Snapshots of prebuilt Ladder endpoints.
+"""
+
+import mmap
+import pickle
+import struct
+
+from ._compat import iteritems, text_type
+
+
+# File header: magic, format version, number of nodes and entries.
+HEADER = struct.Struct('<4sIII')
+MAGIC = b'LDSN'
+VERSION = 1
+
+# Segment node: index of parent node (-1 for the base path) and the offset and
+# length of its segment text.
+NODE = struct.Struct('<iII')
+
+# Named endpoint: index of its node and the offsets and lengths of its name,
+# leading delimiter, trailing delimiter and pickled extra state.
+ENTRY = struct.Struct('<iIIIIIIII')
+
+# State attributes stored as text in entries. Any other attributes which
+# differ from the base path are pickled.
+DELIMITER_ATTRS = ('__leading__', '__trailing__')
+
+
+class RouteSnapshot(object):
+    """Read-only mapping of names to the endpoints of a snapshot file written
+    by `dumpsnapshot`. The file is memory mapped so its pages are shared by
+    every process which loads it. Endpoints are generated from `base`, which
+    should be equivalent to the base path the snapshot was written with (e.g.
+    an ``API`` with a new client), the first time they're accessed. Endpoints
+    sharing path segments share the intermediate instances generated for them.
+
+    Like pickles, snapshots should only be loaded from trusted files.
+    """
+    def __init__(self, filename, base):
+        with open(filename, 'rb') as fileobj:
+            self.map = mmap.mmap(fileobj.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, nodecount, count = HEADER.unpack_from(self.map, 0)
+
+        if magic != MAGIC or version != VERSION:
+            self.map.close()
+            raise ValueError('Not a version {0} route snapshot: {1}'
+                             .format(VERSION, filename))
+
+        self.base = base
+        # Segments of bytes paths (e.g. a BytesPath) are kept as bytes.
+        self.decode = getattr(base, '__pathtype__', text_type) is not bytes
+        self.count = count
+        self.nodestart = HEADER.size
+        self.entrystart = self.nodestart + nodecount * NODE.size
+        self.textstart = self.entrystart + count * ENTRY.size
+        self.nodes = {-1: base}
+        self.endpoints = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        for index in range(self.count):
+            yield self.text(*self.entry(index)[1:3])
+
+    def __contains__(self, name):
+        return self.find(name) is not None
+
+    def __getitem__(self, name):
+        index = self.find(name)
+
+        if index is None:
+            raise KeyError(name)
+
+        return self.endpoint(index)
+
+    def get(self, name, default=None):
+        """Return endpoint for `name` or `default` if there isn't one."""
+        index = self.find(name)
+        return default if index is None else self.endpoint(index)
+
+    def close(self):
+        """Close the memory map of the snapshot file. Endpoints which were
+        already generated can still be used.
+        """
+        self.map.close()
+
+    def text(self, offset, length):
+        """Return text at `offset` of the text section."""
+        start = self.textstart + offset
+        return self.map[start:start + length].decode('utf-8')
+
+    def segment(self, offset, length):
+        """Return path text at `offset` of the text section as the path type
+        of the base path.
+        """
+        if self.decode:
+            return self.text(offset, length)
+
+        start = self.textstart + offset
+        return self.map[start:start + length]
+
+    def entry(self, index):
+        """Return fields of entry at `index`."""
+        return ENTRY.unpack_from(self.map,
+                                 self.entrystart + index * ENTRY.size)
+
+    def find(self, name):
+        """Return index of entry for `name` or ``None`` if there isn't one.
+        Entries are sorted by name so they're binary searched in place.
+        """
+        name = name.encode('utf-8')
+        low, high = 0, self.count
+
+        while low < high:
+            middle = (low + high) // 2
+            _, offset, length = self.entry(middle)[:3]
+            start = self.textstart + offset
+            found = self.map[start:start + length]
+
+            if found < name:
+                low = middle + 1
+            elif found > name:
+                high = middle
+            else:
+                return middle
+
+        return None
+
+    def node(self, index):
+        """Return instance for segment node at `index` by extending the
+        closest already generated ancestor with the segments following it.
+        """
+        nodes = self.nodes
+        pending = []
+
+        while index not in nodes:
+            parent, offset, length = NODE.unpack_from(
+                self.map, self.nodestart + index * NODE.size)
+            pending.append((index, self.segment(offset, length)))
+            index = parent
+
+        path = nodes[index]
+
+        for index, segment in reversed(pending):
+            path = nodes[index] = path.__spawn__(
+                {'__segments__': path.__segments__ + (segment,)})
+
+        return path
+
+    def endpoint(self, index):
+        """Return endpoint for entry at `index`."""
+        endpoint = self.endpoints.get(index)
+
+        if endpoint is not None:
+            return endpoint
+
+        fields = self.entry(index)
+        path = self.node(fields[0])
+        state = {}
+
+        for attr, (offset, length) in zip(DELIMITER_ATTRS,
+                                          (fields[3:5], fields[5:7])):
+            if attr in path.__attrs__:
+                value = self.segment(offset, length)
+
+                if value != getattr(path, attr):
+                    state[attr] = value
+
+        offset, length = fields[7:9]
+
+        if length:
+            start = self.textstart + offset
+            state.update(pickle.loads(self.map[start:start + length]))
+
+        endpoint = self.endpoints[index] = (path.__spawn__(state) if state
+                                            else path)
+
+        return endpoint
+
+
+def dumpsnapshot(filename, base, endpoints):
+    """Write snapshot of `endpoints` generated from Ladder path `base` to
+    `filename` for loading with `RouteSnapshot`. `endpoints` is a dict of
+    names to endpoints. Nested dicts are included with their names joined to
+    their parent's name by a ``.``, e.g. ``{'users': {'detail': ...}}`` is
+    named ``users.detail``.
+
+    Each endpoint must be an instance of the same class as `base` whose path
+    segments start with those of `base`. The path segments following the base
+    segments are stored once per distinct path prefix. Only state which
+    differs from `base` is stored for an endpoint.
+    """
+    if '__segments__' not in base.__attrs__:
+        raise TypeError('{0} has no path segments to snapshot'
+                        .format(type(base).__name__))
+
+    texts = TextTable()
+    nodeindex = {}
+    nodes = []
+    entries = []
+    prefix = len(base.__segments__)
+
+    for name, endpoint in iterendpoints(endpoints):
+        if (type(endpoint) is not type(base) or
+                endpoint.__segments__[:prefix] != base.__segments__):
+            raise ValueError('Endpoint {0!r} is not generated from {1!r}'
+                             .format(name, base))
+
+        node = -1
+
+        for segment in endpoint.__segments__[prefix:]:
+            key = (node, segment)
+
+            if key not in nodeindex:
+                nodeindex[key] = len(nodes)
+                nodes.append((node,) + texts.add(segment))
+
+            node = nodeindex[key]
+
+        extra = {}
+
+        for attr in endpoint.__attrs__:
+            if attr == '__segments__' or attr in DELIMITER_ATTRS:
+                continue
+
+            value = getattr(endpoint, attr)
+            basevalue = getattr(base, attr)
+
+            if value is not basevalue and value != basevalue:
+                extra[attr] = value
+
+        entries.append((name.encode('utf-8'),
+                        node,
+                        texts.add(name),
+                        texts.add(getattr(endpoint, '__leading__', '')),
+                        texts.add(getattr(endpoint, '__trailing__', '')),
+                        texts.add(pickle.dumps(extra, 2) if extra else b'')))
+
+    entries.sort(key=lambda entry: entry[0])
+
+    with open(filename, 'wb') as fileobj:
+        fileobj.write(HEADER.pack(MAGIC, VERSION, len(nodes), len(entries)))
+
+        for node in nodes:
+            fileobj.write(NODE.pack(*node))
+
+        for _, node, name, leading, trailing, extra in entries:
+            fileobj.write(ENTRY.pack(node, *(name + leading + trailing +
+                                             extra)))
+
+        fileobj.write(texts.getvalue())
+
+
+def iterendpoints(endpoints, prefix=''):
+    """Return iterator of ``(name, endpoint)`` for a dict of `endpoints`
+    which may contain nested dicts of endpoints.
+    """
+    stack = [(prefix, iteritems(endpoints))]
+
+    while stack:
+        prefix, items = stack[-1]
+
+        for name, endpoint in items:
+            name = prefix + name
+
+            if isinstance(endpoint, dict):
+                stack.append((name + '.', iteritems(endpoint)))
+                break
+
+            yield name, endpoint
+        else:
+            stack.pop()
+
+
+class TextTable(object):
+    """Text section of a snapshot file in which identical values are only
+    stored once.
+    """
+    def __init__(self):
+        self.offsets = {}
+        self.chunks = []
+        self.size = 0
+
+    def add(self, value):
+        """Add text or bytes `value` and return its ``(offset, length)``."""
+        if isinstance(value, text_type):
+            value = value.encode('utf-8')
+
+        if value not in self.offsets:
+            self.offsets[value] = self.size
+            self.chunks.append(value)
+            self.size += len(value)
+
+        return (self.offsets[value], len(value))
+
+    def getvalue(self):
+        """Return the text section as bytes."""
+        return b''.join(self.chunks)
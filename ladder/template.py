@@ -0,0 +1,99 @@
+"""Compiled route templates.
+"""
+
+from string import Formatter
+
+from .params import EMPTY_PARAMS, encodepairs
+from .urlpath import URLPath, flatten_params
+from ._compat import iteritems
+
+
+class RouteTemplate(object):
+    """Route template compiled from a `URLPath` or `DelimitedPath` whose path
+    contains ``str.format`` placeholders, e.g. ``/users/{user_id}``. The path
+    is generated and rendered once so formatting the template is a single
+    string build without any path joining or URL parsing.
+
+    Calling the template formats it with the placeholder values. Keyword
+    arguments which aren't placeholders of a `URLPath` template are added as
+    query string parameters.
+    """
+    def __init__(self, path):
+        self.path = path
+
+        if isinstance(path, URLPath):
+            bare = path.__spawn__({'__params__': EMPTY_PARAMS,
+                                   '__fragment__': ''})
+            self.pathway = bare.__getpathway__()
+            self.query = path.__params__.encode()
+            self.fragment = path.__fragment__
+            self.allows_params = True
+        else:
+            self.pathway = path.__getpathway__()
+            self.query = ''
+            self.fragment = ''
+            self.allows_params = False
+
+        fields = [field for _, field, _, _ in
+                  Formatter().parse(self.pathway + self.fragment)
+                  if field is not None]
+
+        self.fields = tuple(sorted(set(fields), key=fields.index))
+        self.names = frozenset(fields)
+        self.template = self.pathway
+
+        if self.query:
+            # Braces in the query string are percent-encoded anyway.
+            self.template += '?' + self.query
+
+        if self.fragment:
+            self.template += '#' + self.fragment
+
+        self.render = self.template.format
+
+    def __repr__(self):  # pragma: no cover
+        return '<{0} template="{1}">'.format(self.__class__.__name__,
+                                             self.template)
+
+    def __call__(self, *args, **params):
+        """Return template formatted with positional and named placeholder
+        values. Any other named values are added as query string parameters
+        of a `URLPath` template and otherwise raise ``TypeError``.
+        """
+        if not (self.allows_params or self.names.issuperset(params)):
+            raise TypeError('{0!r} got unexpected keyword arguments: {1}'
+                            .format(self, ', '.join(sorted(set(params) -
+                                                           self.names))))
+
+        try:
+            if self.allows_params and not self.names.issuperset(params):
+                return self.format_with_params(args, params)
+            return self.render(*args, **params)
+        except (IndexError, KeyError) as exc:
+            raise TypeError('{0!r} must be called with correct format '
+                            'arguments: missing {1}'.format(self, exc))
+
+    def format_with_params(self, args, params):
+        """Return template formatted with placeholder values from `args` and
+        `params` while adding the other `params` to the query string.
+        """
+        values = {}
+        extra = []
+
+        for name, value in iteritems(params):
+            if name in self.names:
+                values[name] = value
+            else:
+                extra.append((name, value))
+
+        url = self.pathway.format(*args, **values)
+        query = '&'.join(filter(None, [self.query,
+                                       encodepairs(flatten_params(extra))]))
+
+        if query:
+            url += '?' + query
+
+        if self.fragment:
+            url += '#' + self.fragment.format(*args, **values)
+
+        return url
@@ -2,13 +2,22 @@
 """
 
 from .ladder import Ladder
-from .utils import urlpathjoin
+from .params import EMPTY_PARAMS
+from .utils import (
+    EMPTY_SEGMENTS,
+    delimitedpathrender,
+    joinsegments,
+    pathsegments)
+from . import _compat
 from ._compat import (
-    iteritems,
-    urlencode,
-    urlsplit,
-    urlunsplit,
-    parse_qsl)
+    iteritems)
+
+
+# Characters allowed in a URL scheme after its leading letter.
+SCHEME_CHARS = frozenset('abcdefghijklmnopqrstuvwxyz'
+                         'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+                         '0123456789'
+                         '+-.')
 
 
 class URLSplitParts(object):
@@ -34,87 +43,171 @@ class URLSplitParts(object):
 class URLPath(Ladder):
     """Generate URLs using Ladder interface."""
 
-    __attrs__ = ['__pathway__', '__params__', '__append_slash__']
+    __attrs__ = ['__scheme__', '__netloc__', '__leading__', '__segments__',
+                 '__trailing__', '__params__', '__fragment__',
+                 '__append_slash__']
+    __slots__ = tuple(__attrs__)
 
     def __init__(self, pathway=None, params=None, append_slash=False):
-        self.__pathway__ = urlpathjoin(pathway)
         self.__append_slash__ = append_slash
-        self.__params__ = []
+        self.__scheme__ = ''
+        self.__netloc__ = ''
+        (self.__leading__,
+         self.__segments__,
+         self.__trailing__) = EMPTY_SEGMENTS
+        self.__params__ = EMPTY_PARAMS
+        self.__fragment__ = ''
+
+        self.__setstate__(self.__joinstate__((pathway,), params))
 
-        self.__setparams__(params)
+    def __issegment__(self, path):
+        """Return whether `path` is added to our path as is."""
+        return not (path.startswith('/') or path.endswith('/') or
+                    '?' in path or '#' in path)
 
-    def __getpathway__(self):
-        """Return current URL as string. Combines query string parameters found
+    def __renderpathway__(self):
+        """Render current URL as string. Combines query string parameters found
         in string URL with any named parameters created during `__call__`."""
-        urlparts = self.__urlparts__
+        scheme, netloc, path, query, fragment = self.__urlsplit__
+        url = path
 
-        if self.__append_slash__ and not urlparts.path.endswith('/'):
-            urlparts.path = urlparts.path + '/'
+        if scheme or netloc:
+            if path and not path.startswith('/'):
+                url = '/' + path
+            url = '//' + netloc + url
 
-        urlparts.query = urlencode(self.__params__)
+        if scheme:
+            url = scheme + ':' + url
 
-        return urlunsplit(urlparts)
+        if query:
+            url += '?' + query
 
-    def __setparams__(self, params):
-        """Extract any query string parameters from URL and merge with
-        `params`.
+        if fragment:
+            url += '#' + fragment
+
+        return url
+
+    @property
+    def __segmentstate__(self):
+        """Return ``(leading, segments, trailing)`` segment state of URL path.
         """
-        urlparts = self.__urlparts__
+        return (self.__leading__, self.__segments__, self.__trailing__)
+
+    def __joinstate__(self, paths, params):
+        """Return state from extending our URL with `paths` and query `params`.
+        Only `paths` are parsed since our own state is already split. The
+        scheme and netloc are only parsed from `paths` if we don't have a path
+        yet.
+        """
+        state = self.__segmentstate__
+        scheme, netloc = self.__scheme__, self.__netloc__
+        anchored = bool(scheme or netloc)
+        paths = pathsegments(paths)
+
+        if paths and not anchored and not any(state):
+            scheme, netloc, paths[0] = splitorigin(paths[0])
+            # When the URL is the only path it's kept verbatim. Otherwise, its
+            # path is joined to the netloc like any other path.
+            anchored = bool(scheme or netloc) and len(paths) > 1
+
+        paths, query, fragment = splitquery(paths)
+
+        if (paths and not paths[-1] and
+                (len(paths) > 1 or anchored or any(state))):
+            # A query string directly following a path delimits that path
+            # with a trailing slash, i.e., "/foo" + "?a=1" => "/foo/?a=1".
+            paths[-1] = '/'
 
-        if urlparts.query:
-            # move url query to params and remove it from url string
-            self.__params__ += parse_qsl(urlparts.query)
-            urlparts.query = None
-            self.__pathway__ = urlunsplit(urlparts)
+        leading, segments, trailing = joinsegments('/',
+                                                   [path for path in paths
+                                                    if path],
+                                                   state,
+                                                   anchored)
 
-        if params:
-            self.__params__ += flatten_params(params)
+        if leading and not segments:
+            # A path of only slashes is the root path. Rendering it as "//"
+            # would make it a protocol-relative URL.
+            leading, trailing = '/', ''
+
+        state = {'__scheme__': scheme,
+                 '__netloc__': netloc,
+                 '__leading__': leading,
+                 '__segments__': segments,
+                 '__trailing__': trailing,
+                 '__fragment__': fragment or self.__fragment__}
+
+        if query or params:
+            state['__params__'] = self.__params__
+
+            if query:
+                state['__params__'] = state['__params__'].prepend(
+                    _compat.parse_qsl(query))
+
+            if params:
+                state['__params__'] = state['__params__'].extend(
+                    flatten_params(params))
+
+        return state
+
+    def __statekey__(self):
+        """Return our rendered URL and whether we append slashes."""
+        return (self.__getpathway__(), self.__append_slash__)
 
     @property
     def __urlsplit__(self):
-        """Return urlsplit() of current URL."""
-        return urlsplit(self.__pathway__)
+        """Return urlsplit() of current URL. It's assembled from our already
+        split state instead of parsing the URL string.
+        """
+        path = delimitedpathrender('/', self.__segmentstate__)
+
+        if self.__append_slash__ and not path.endswith('/'):
+            path += '/'
+
+        return _compat.SplitResult(self.__scheme__,
+                                   self.__netloc__,
+                                   path,
+                                   self.__params__.encode(),
+                                   self.__fragment__)
 
     @property
     def __urlparts__(self):
         """Return urlsplit as URLSplitParts object."""
         return URLSplitParts(*self.__urlsplit__)
 
-    def __getattr__(self, path):
-        """Treat attribute access as path concatenation."""
-        return self(path)
+    def __preparestate__(self, *paths, **params):
+        """Extend the URL with `paths` and query `params`."""
+        return self.__joinstate__(paths, params)
+
+    def __replaceparams__(self, **params):
+        """Return copy of URL with all values of each of `params` replaced by
+        its value. A list or tuple value gives multiple values.
+        """
+        query = self.__params__
+
+        for key, values in iteritems(params):
+            query = query.replace(key, values)
+
+        return self.__spawn__({'__params__': query})
 
-    def __call__(self, *paths, **params):
-        """Generate a new URL while extending the `url` with `path` and query
-        `params`.
+    def __link__(self, url):
+        """Return copy of ourself for `url` (e.g. a link found in a response)
+        resolved against our URL like ``urljoin`` does, e.g. a relative path
+        or a query is resolved against our path and a ``//netloc`` URL keeps
+        our scheme.
         """
-        state = self.__getstate__()
-
-        state['pathway'] = urlpathjoin(state['pathway'], *paths)
-        state['params'] = state['params'] + list(iteritems(params))
-
-        # Use `__class__` to spawn new generation in case we are a subclass.
-        return self.__class__(**state)
-
-# class StrictURL(URL):
-#    def __init__(self, url=None):
-#        super(StrictURL, self).__init__(url=url)
-#
-#    def __getattr__(self, attr):
-#        raise AttributeError(attr)
-#
-#    def __call__(self, *args, **kargs):
-#        state = self.__getstate__()
-#
-#        try:
-#            url = state['url'].format(*args, **kargs)
-#        except IndexError:
-#            raise TypeError(
-#                ('{0} must be called with correct format arguments.'
-#                 .format(repr(self)))
-#            )
-#
-#        return self.__class__(**state)
+        state = {'__scheme__': '',
+                 '__netloc__': '',
+                 '__leading__': '',
+                 '__segments__': (),
+                 '__trailing__': '',
+                 '__params__': EMPTY_PARAMS,
+                 '__fragment__': ''}
+
+        return self.__spawn__(state)(_compat.urljoin(str(self), url))
+
+    def __removeparams__(self, *keys):
+        """Return copy of URL without any values of query params `keys`."""
+        return self.__spawn__({'__params__': self.__params__.remove(*keys)})
 
 
 def flatten_params(params):
@@ -136,3 +229,78 @@ def flatten_params(params):
             flattened.append((param, value))
 
     return flattened
+
+
+def splitorigin(url):
+    """Split the scheme and netloc from the start of `url`. Only URLs with a
+    netloc (i.e. ``scheme://netloc`` or ``//netloc``) are split. The rest of
+    the URL is returned unparsed.
+
+    >>> splitorigin('http://github.com:8000/foo?a=1')
+    ('http', 'github.com:8000', '/foo?a=1')
+    >>> splitorigin('//github.com')
+    ('', 'github.com', '')
+    >>> splitorigin('/foo')
+    ('', '', '/foo')
+    >>> splitorigin('file:///foo')
+    ('', '', 'file:///foo')
+    """
+    scheme = ''
+    rest = url
+    colon = url.find(':')
+
+    if (colon > 0 and url[:1].isalpha() and
+            url[colon + 1:colon + 3] == '//' and
+            all(char in SCHEME_CHARS for char in url[:colon])):
+        scheme = url[:colon].lower()
+        rest = url[colon + 1:]
+
+    if not rest.startswith('//'):
+        return '', '', url
+
+    end = len(rest)
+    for char in '/?#':
+        index = rest.find(char, 2)
+        if 0 <= index < end:
+            end = index
+
+    if end == 2:
+        # No netloc to split.
+        return '', '', url
+
+    return scheme, rest[2:end], rest[end:]
+
+
+def splitquery(paths):
+    """Split URL paths into the path parts preceding the first query string or
+    fragment along with that query string and fragment. Any paths following a
+    query string or fragment are considered part of it. The path part which
+    contained the query string or fragment is kept even if empty. `paths` is
+    a list of non-empty text paths as returned by ``pathsegments()``.
+
+    >>> splitquery(['a', 'b?x=1#top'])
+    (['a', 'b'], 'x=1', 'top')
+    >>> splitquery(['a', '?x=1'])
+    (['a', ''], 'x=1', '')
+    >>> splitquery(['a#top', 'b'])
+    (['a'], '', 'top/b')
+    """
+    for index, path in enumerate(paths):
+        if '?' not in path and '#' not in path:
+            continue
+
+        tail = '/'.join([path] + paths[index + 1:])
+        paths = paths[:index]
+
+        if '#' in path and ('?' not in path or
+                            path.index('#') < path.index('?')):
+            path, _, fragment = tail.partition('#')
+            query = ''
+        else:
+            path, _, query = tail.partition('?')
+            query, _, fragment = query.partition('#')
+
+        paths.append(path)
+        return paths, query, fragment
+
+    return paths, '', ''
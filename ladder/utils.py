@@ -2,13 +2,22 @@
 """
 
 import os
+from collections import deque
 from functools import wraps
+from itertools import islice
 
 from ._compat import (
     text_type
 )
 
 
+# Segment state of an empty delimited path. See delimitedpathsegments().
+EMPTY_SEGMENTS = ('', (), '')
+
+# Segment state of an empty delimited bytes path.
+EMPTY_BYTES_SEGMENTS = (b'', (), b'')
+
+
 def require_override(func):
     """Decorator which raises NotImplementedError when method called."""
     # pylint: disable=missing-docstring,unused-argument
@@ -20,7 +29,7 @@ def require_override(func):
 
 def ospathjoin(*paths):
     """Join OS path into a single path."""
-    paths = [text_type(path) for path in flatten(paths) if path]
+    paths = pathsegments(paths)
     return os.path.join(*paths) if paths else ''
 
 
@@ -41,22 +50,111 @@ def delimitedpathjoin(delimiter, *paths):
     >>> assert delimitedpathjoin('.', '.', 'a', 'b', 'c', 1, '.') == ret
     >>> assert delimitedpathjoin('.', []) == ''
     """
-    paths = [text_type(path) for path in flatten(paths) if path]
+    return delimitedpathrender(delimiter,
+                               delimitedpathsegments(delimiter, paths))
+
+
+def delimitedpathsegments(delimiter, paths, state=EMPTY_SEGMENTS,
+                          anchored=False):
+    """Extend the segment `state` of a delimited path with `paths`. A segment
+    state is a ``(leading, segments, trailing)`` tuple where `segments` is a
+    tuple of the non-empty path parts with `delimiter` stripped from both ends
+    and `leading`/`trailing` hold the delimiter text kept at either end of the
+    joined path. Segments already in `state` are shared with the result as is
+    so that extending a path only normalizes the newly added parts. If
+    `anchored`, then `state` follows something else (e.g. the netloc of a URL)
+    so it's treated as non-empty and never has a leading delimiter.
+
+    >>> delimitedpathsegments('.', ['.a.', 'b'])
+    ('.', ('a', 'b'), '')
+    >>> delimitedpathsegments('.', ['c.'], ('.', ('a', 'b'), ''))
+    ('.', ('a', 'b', 'c'), '.')
+    >>> delimitedpathsegments('.', ['..a'])
+    ('..', ('a',), '')
+    >>> delimitedpathsegments('.', ['..a'], anchored=True)
+    ('', ('a',), '')
+    """
+    return joinsegments(delimiter, pathsegments(paths), state, anchored)
+
+
+def joinsegments(delimiter, paths, state=EMPTY_SEGMENTS, anchored=False):
+    """Extend the segment `state` of a delimited path with `paths`, a list of
+    non-empty paths as returned by `pathsegments`. See
+    `delimitedpathsegments`. The `delimiter`, `paths` and `state` may be
+    bytes instead of text as long as they all are.
 
-    if len(paths) == 1:
-        # Special case where there's no need to join anything.
-        # Doing this because if path==[delimiter], then an extra slash would be
-        # added if the else clause ran instead.
+    Leading and trailing delimiters are only kept when a path starts or ends
+    with the whole delimiter but, like ``str.strip()``, any characters of the
+    delimiter are stripped from the ends of each path.
+
+    >>> state = joinsegments(b':', [b'a', b'1:'], (b'', (b'key',), b''))
+    >>> assert state == (b'', (b'key', b'a', b'1'), b':')
+    >>> joinsegments('::', [':', 'b:'], ('', ('a',), ''))
+    ('', ('a', 'b'), '')
+    >>> joinsegments('::', ['::b::'], ('', ('a',), ''))
+    ('', ('a', 'b'), '::')
+    >>> joinsegments('::', ['a'], (':', (), ''))
+    ('', ('a',), '')
+    """
+    if not paths:
+        return state
+
+    leading, segments, trailing = state
+
+    if not (anchored or leading or segments or trailing) and len(paths) == 1:
+        # Special case where there's no need to join anything so the path is
+        # kept verbatim. Doing this because if path==[delimiter], then an
+        # extra delimiter would be added if it were treated as a join.
         path = paths[0]
+        stripped = path.strip(delimiter)
+
+        if not stripped:
+            return (path, (), path[:0])
+
+        return (path[:len(path) - len(path.lstrip(delimiter))],
+                (stripped,),
+                path[len(path.rstrip(delimiter)):])
+
+    empty = delimiter[:0]
+
+    if anchored:
+        leading = empty
+    elif leading or segments or trailing:
+        leading = delimiter if leading.startswith(delimiter) else empty
     else:
-        leading = delimiter if paths and paths[0].startswith(delimiter) else ''
-        trailing = delimiter if paths and paths[-1].endswith(delimiter) else ''
-        path = ''.join([leading,
-                        delimiter.join([p.strip(delimiter)
-                                        for p in paths if p.strip(delimiter)]),
-                        trailing])
+        leading = delimiter if paths[0].startswith(delimiter) else empty
 
-    return path
+    trailing = delimiter if paths[-1].endswith(delimiter) else empty
+
+    if len(delimiter) != 1:
+        # Paths are stripped of every character of the delimiter like
+        # str.strip() does, so they can't be checked with startswith().
+        added = [path for path in [path.strip(delimiter) for path in paths]
+                 if path]
+        return (leading, segments + tuple(added), trailing)
+
+    added = []
+
+    for path in paths:
+        if path.startswith(delimiter) or path.endswith(delimiter):
+            path = path.strip(delimiter)
+
+            if not path:
+                continue
+
+        added.append(path)
+
+    return (leading, segments + tuple(added), trailing)
+
+
+def delimitedpathrender(delimiter, state):
+    """Render a delimited path segment state as a string.
+
+    >>> delimitedpathrender('.', ('.', ('a', 'b'), '.'))
+    '.a.b.'
+    """
+    leading, segments, trailing = state
+    return leading + delimiter.join(segments) + trailing
 
 
 def urlpathjoin(*paths):
@@ -67,16 +165,23 @@ def urlpathjoin(*paths):
 
 
 def iterflatten(items):
-    """Return iterator which flattens list/tuple of lists/tuples
+    """Return iterator which flattens list/tuple of lists/tuples. Nested lists
+    are tracked on an explicit stack so any depth of nesting is supported.
+
     >>> to_flatten = [1, [2,3], [4, [5, [6]], 7], 8]
     >>> assert list(iterflatten(to_flatten)) == [1,2,3,4,5,6,7,8]
     """
-    for item in items:
-        if isinstance(item, (list, tuple)):
-            for itm in iterflatten(item):
-                yield itm
-        else:
+    stack = [iter(items)]
+
+    while stack:
+        for item in stack[-1]:
+            if isinstance(item, (list, tuple)):
+                stack.append(iter(item))
+                break
+
             yield item
+        else:
+            stack.pop()
 
 
 def flatten(items):
@@ -84,3 +189,122 @@ def flatten(items):
     >>> assert flatten([1, [2,3], [4, [5, [6]], 7], 8]) == [1,2,3,4,5,6,7,8]
     """
     return list(iterflatten(items))
+
+
+def pathsegments(paths, pathtype=text_type, convert=text_type):
+    """Return flattened list of the non-empty `paths` converted to text, or
+    to `pathtype` by calling `convert` with them. Paths which already are a
+    `pathtype` are used as is.
+
+    >>> assert pathsegments(['a', ['', 1, None], ('b',)]) == ['a', '1', 'b']
+    >>> paths = pathsegments([b'a', [1, u'b']], bytes, bytessegment)
+    >>> assert paths == [b'a', b'1', b'b']
+    """
+    if (isinstance(paths, (list, tuple)) and len(paths) == 1 and
+            isinstance(paths[0], pathtype)):
+        # Single path, e.g. a child of a path generated from an attribute.
+        return [paths[0]] if paths[0] else []
+
+    segments = []
+    stack = [iter(paths)]
+
+    while stack:
+        for path in stack[-1]:
+            if isinstance(path, pathtype):
+                if path:
+                    segments.append(path)
+            elif isinstance(path, (list, tuple)):
+                stack.append(iter(path))
+                break
+            elif path:
+                segments.append(convert(path))
+        else:
+            stack.pop()
+
+    return segments
+
+
+def bytessegment(path):
+    """Return `path` as bytes. Text is UTF-8 encoded and anything else
+    except other bytes-like objects and objects which define ``__bytes__``
+    is converted to text first, e.g. ``1`` becomes ``b'1'``.
+    """
+    if isinstance(path, bytes):
+        return path
+
+    if type(path) is int:
+        # Bytes %-formatting isn't available on Python 3.2-3.4.
+        return str(path).encode('ascii')
+
+    if (isinstance(path, (bytearray, memoryview)) or
+            hasattr(type(path), '__bytes__')):
+        # E.g. a BytesPath, which is used as is instead of being decoded.
+        return bytes(path)
+
+    if not isinstance(path, text_type):
+        path = text_type(path)
+
+    return path.encode('utf-8')
+
+
+def chunked(items, size):
+    """Return iterator of lists of up to `size` items from `items`.
+
+    >>> assert list(chunked(range(5), 2)) == [[0, 1], [2, 3], [4]]
+    """
+    items = iter(items)
+
+    while True:
+        chunk = list(islice(items, size))
+
+        if not chunk:
+            return
+
+        yield chunk
+
+
+def threadmap(func, items, max_workers, ordered=True):
+    """Return iterator of ``(item, future)`` for calling `func` with each item
+    in `items` on a pool of `max_workers` threads. Futures are done when
+    they're yielded. If `ordered`, then they're yielded in the order of `items`
+    and otherwise as they complete. Only a bounded number of calls are
+    submitted ahead so that `items` is consumed lazily.
+
+    Requires ``concurrent.futures`` (available as the ``futures`` package on
+    Python 2).
+    """
+    from concurrent.futures import (
+        FIRST_COMPLETED, ThreadPoolExecutor, wait)
+
+    items = iter(items)
+    executor = ThreadPoolExecutor(max_workers)
+    pending = deque()
+
+    def submit(count):
+        for item in islice(items, count):
+            pending.append((item, executor.submit(func, item)))
+
+    try:
+        submit(2 * max_workers)
+
+        while pending:
+            if ordered:
+                item, future = pending.popleft()
+                wait([future])
+                yield item, future
+                submit(1)
+                continue
+
+            done, _ = wait([future for _, future in pending],
+                           return_when=FIRST_COMPLETED)
+
+            for item, future in list(pending):
+                if future in done:
+                    pending.remove((item, future))
+                    yield item, future
+
+            submit(len(done))
+    finally:
+        for _, future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
@@ -1,4 +1,6 @@
 
+import time
+from threading import Lock
 from unittest import TestCase
 
 from ladder import API
@@ -112,3 +114,171 @@ class TestAPI(TestCase):
         self.assertEqual(
             str(self.api_upper.foo.delete(a=1)),
             'http://github.com/foo/delete?a=1')
+
+    def test_url_rendered_once(self):
+        endpoint = self.api_upper.foo(a=1)
+        first = endpoint.GET()[1][0]
+        second = endpoint.GET()[1][0]
+        self.assertEqual(first, 'http://github.com/foo?a=1')
+        self.assertTrue(first is second)
+
+
+class SlowClient(object):
+    def __init__(self):
+        self.lock = Lock()
+        self.active = 0
+        self.max_active = 0
+
+    def get(self, url, *args, **kargs):
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.active, self.max_active)
+
+        # Later items finish first.
+        time.sleep(0.05 / int(url.rsplit('/', 1)[-1]))
+
+        with self.lock:
+            self.active -= 1
+
+        if url.endswith('/3'):
+            raise ValueError(url)
+
+        return ('get', (url,) + args, kargs)
+
+
+class TestAPIMap(TestCase):
+    def test_ordered(self):
+        api = API(MockClient(), 'http://github.com')
+        results = api.users.__map__('GET', [1, 2, 3], a=1, max_workers=2)
+        self.assertFalse(isinstance(results, list))
+        self.assertEqual(list(results), [
+            ('get', ('http://github.com/users/1',), {'a': 1}),
+            ('get', ('http://github.com/users/2',), {'a': 1}),
+            ('get', ('http://github.com/users/3',), {'a': 1}),
+        ])
+
+    def test_unordered(self):
+        api = API(SlowClient(), 'http://github.com', upper_methods=False)
+        results = list(api.users.__map__('get', [1, 2, 4, 8],
+                                         ordered=False))
+        self.assertEqual([item for item, _ in results], [8, 4, 2, 1])
+        self.assertEqual(results[0][1],
+                         ('get', ('http://github.com/users/8',), {}))
+
+    def test_bounded_workers(self):
+        client = SlowClient()
+        api = API(client, 'http://github.com')
+        list(api.users.__map__('GET', [1, 2, 4, 8, 16], max_workers=2))
+        self.assertEqual(client.max_active, 2)
+
+    def test_exceptions(self):
+        api = API(SlowClient(), 'http://github.com')
+        results = api.users.__map__('GET', [1, 2, 3, 4])
+        self.assertEqual(next(results)[1], ('http://github.com/users/1',))
+        self.assertEqual(next(results)[1], ('http://github.com/users/2',))
+        self.assertRaises(ValueError, next, results)
+
+        results = list(api.users.__map__('GET', [1, 2, 3, 4],
+                                         return_exceptions=True))
+        self.assertEqual(len(results), 4)
+        self.assertTrue(isinstance(results[2], ValueError))
+        self.assertEqual(results[3][1], ('http://github.com/users/4',))
+
+
+class PagingClient(object):
+    def __init__(self, pages):
+        self.pages = pages
+        self.urls = []
+
+    def get(self, url, **kargs):
+        self.urls.append(url)
+        query = dict(param.split('=') for param in
+                     url.partition('?')[2].split('&') if param)
+        page = int(query.get('page') or query.get('cursor') or 1)
+        items = self.pages[page - 1] if page <= len(self.pages) else []
+        next_page = page + 1 if page < len(self.pages) else None
+
+        return {'items': items, 'next': next_page, 'kargs': kargs}
+
+
+class TestAPIPaginate(TestCase):
+    pages = [[1, 2], [3, 4], [5]]
+
+    def test_page_param(self):
+        client = PagingClient(self.pages)
+        api = API(client, 'http://github.com', params={'page': 9, 'a': 1})
+        results = api.items.__paginate__('GET', page_param='page',
+                                         items=lambda response:
+                                         response['items'])
+
+        self.assertFalse(isinstance(results, list))
+        self.assertEqual(list(results), [1, 2, 3, 4, 5])
+        self.assertEqual(client.urls, [
+            'http://github.com/items?a=1&page=1',
+            'http://github.com/items?a=1&page=2',
+            'http://github.com/items?a=1&page=3',
+            'http://github.com/items?a=1&page=4',
+        ])
+
+    def test_start(self):
+        client = PagingClient(self.pages)
+        api = API(client, 'http://github.com')
+        results = api.items.__paginate__('get', timeout=1, page_param='page',
+                                         start=2, items=lambda response:
+                                         response['items'])
+
+        self.assertEqual(list(results), [3, 4, 5])
+        self.assertEqual(client.urls[0], 'http://github.com/items?page=2')
+
+    def test_cursor(self):
+        client = PagingClient(self.pages)
+        api = API(client, 'http://github.com')
+
+        def next_page(response):
+            if response['next']:
+                return {'cursor': response['next']}
+
+        pages = list(api.items.__paginate__('GET', next_page=next_page,
+                                            items=lambda response:
+                                            [response]))
+
+        self.assertEqual([page['items'] for page in pages], self.pages)
+        self.assertEqual(client.urls[1:], [
+            'http://github.com/items?cursor=2',
+            'http://github.com/items?cursor=3',
+        ])
+
+    def test_next_link(self):
+        client = PagingClient(self.pages)
+        api = API(client, 'http://github.com', params={'a': 1})
+
+        def next_page(response):
+            if response['next'] == 2:
+                return '/items/?page=2'
+            elif response['next'] == 3:
+                return 'https://api.github.com/items?page=3'
+
+        results = api.items.__paginate__('GET', next_page=next_page,
+                                         items=lambda response:
+                                         response['items'])
+
+        self.assertEqual(list(results), [1, 2, 3, 4, 5])
+        self.assertEqual(client.urls, [
+            'http://github.com/items?a=1',
+            'http://github.com/items/?page=2',
+            'https://api.github.com/items?page=3',
+        ])
+
+    def test_prefetch(self):
+        client = PagingClient(self.pages)
+        api = API(client, 'http://github.com')
+        results = api.items.__paginate__('GET', page_param='page',
+                                         items=lambda response:
+                                         response['items'])
+
+        self.assertEqual(next(results), 1)
+        time.sleep(0.05)
+        self.assertEqual(len(client.urls), 2)
+        results.close()
+        time.sleep(0.05)
+        self.assertEqual(len(client.urls), 2)
@@ -0,0 +1,170 @@
+
+import asyncio
+import pickle
+import time
+from unittest import TestCase
+
+from ladder import (
+    AdaptiveConcurrency, AsyncAPI, ResponseCache, RouteStats, TokenBucket)
+
+
+class MockAsyncClient(object):
+    def __init__(self, delay=0):
+        self.delay = delay
+        self.active = 0
+        self.max_active = 0
+
+    async def request(self, method, url, *args, **kargs):
+        self.active += 1
+        self.max_active = max(self.active, self.max_active)
+        await asyncio.sleep(self.delay)
+        self.active -= 1
+
+        if url.endswith('/error'):
+            raise ValueError(url)
+
+        return (method, (url,) + args, kargs)
+
+    def get(self, *args, **kargs):
+        return self.request('get', *args, **kargs)
+
+    def post(self, *args, **kargs):
+        return self.request('post', *args, **kargs)
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+class TestAsyncAPI(TestCase):
+    def test_methods(self):
+        api = AsyncAPI(MockAsyncClient(), 'http://github.com')
+        self.assertEqual(run(api.foo.GET(a=1)),
+                         ('get', ('http://github.com/foo',), {'a': 1}))
+        self.assertEqual(str(api.foo.get), 'http://github.com/foo/get')
+
+    def test_lower_methods(self):
+        api = AsyncAPI(MockAsyncClient(), 'http://github.com',
+                       upper_methods=False)
+        self.assertEqual(run(api.foo(b=2).post({'c': 3})),
+                         ('post', ('http://github.com/foo?b=2', {'c': 3}), {}))
+
+    def test_gather(self):
+        api = AsyncAPI(MockAsyncClient(), 'http://github.com')
+        results = run(api.users.__gather__('GET', [3, 1, 2], a=1))
+        self.assertEqual(results, [
+            ('get', ('http://github.com/users/3',), {'a': 1}),
+            ('get', ('http://github.com/users/1',), {'a': 1}),
+            ('get', ('http://github.com/users/2',), {'a': 1}),
+        ])
+
+    def test_gather_exceptions(self):
+        api = AsyncAPI(MockAsyncClient(), 'http://github.com')
+        self.assertRaises(ValueError, run,
+                          api.__gather__('GET', ['ok', 'error']))
+
+        results = run(api.__gather__('GET', ['ok', 'error'],
+                                     return_exceptions=True))
+        self.assertEqual(results[0][1], ('http://github.com/ok',))
+        self.assertTrue(isinstance(results[1], ValueError))
+
+    def test_concurrency_limit(self):
+        client = MockAsyncClient(delay=0.01)
+        api = AsyncAPI(client, 'http://github.com', concurrency=3)
+        results = run(api.users.__gather__('GET', range(1, 11)))
+        self.assertEqual(len(results), 10)
+        self.assertEqual(client.max_active, 3)
+
+        # Each event loop gets its own semaphore with the same limit.
+        run(api.items.__gather__('GET', range(1, 5)))
+        self.assertEqual(client.max_active, 3)
+
+    def test_unlimited_concurrency(self):
+        client = MockAsyncClient(delay=0.01)
+        api = AsyncAPI(client, 'http://github.com')
+        run(api.users.__gather__('GET', range(1, 11)))
+        self.assertEqual(client.max_active, 10)
+
+    def test_hooks(self):
+        stats = RouteStats()
+        api = AsyncAPI(MockAsyncClient(), 'http://github.com', hooks=[stats])
+        run(api.users.__gather__('GET', [1, 2, 'error'],
+                                 return_exceptions=True))
+
+        snapshot = stats.snapshot()
+        self.assertEqual(snapshot[('GET', '/users/{id}')].count, 2)
+        self.assertEqual(snapshot[('GET', '/users/error')].errors, 1)
+
+    def test_pickle(self):
+        client = MockAsyncClient(delay=0.01)
+        api = AsyncAPI(client, 'http://github.com', concurrency=2)
+        run(api.users.__gather__('GET', range(1, 5)))
+
+        restored = pickle.loads(pickle.dumps(api.users))
+        self.assertEqual(str(restored), 'http://github.com/users')
+        self.assertEqual(restored.__limiter__.limit, 2)
+        run(restored.__gather__('GET', range(1, 5)))
+        self.assertEqual(restored.__client__.max_active, 2)
+
+    def test_response_cache(self):
+        client = MockAsyncClient()
+        cache = ResponseCache()
+        api = AsyncAPI(client, 'http://github.com', response_cache=cache)
+        run(api.users.__gather__('GET', [1, 2, 1]))
+        run(api.users(1).GET())
+        run(api.users(1).POST())
+
+        # Both concurrent requests for user 1 miss the cache.
+        self.assertEqual(cache.info().currsize, 2)
+        self.assertEqual(cache.info().hits, 1)
+
+    def test_coalesce(self):
+        client = MockAsyncClient(delay=0.01)
+        api = AsyncAPI(client, 'http://github.com', coalesce=True,
+                       concurrency=1)
+        results = run(api.__gather__('GET', ['a', 'a', 'b', 'a', 'error',
+                                             'error'],
+                                     return_exceptions=True))
+
+        self.assertEqual(client.max_active, 1)
+        self.assertTrue(results[0] is results[1] is results[3])
+        self.assertFalse(results[0] is results[2])
+        self.assertTrue(results[4] is results[5])
+        self.assertTrue(isinstance(results[4], ValueError))
+        self.assertEqual(len(api.__flights__), 0)
+
+    def test_coalesce_cancelled(self):
+        client = MockAsyncClient(delay=0.05)
+        api = AsyncAPI(client, 'http://github.com', coalesce=True)
+
+        async def main():
+            first = asyncio.ensure_future(api.a.GET())
+            second = asyncio.ensure_future(api.a.GET())
+            await asyncio.sleep(0.01)
+            second.cancel()
+            return await first
+
+        self.assertEqual(run(main()), ('get', ('http://github.com/a',), {}))
+
+    def test_adaptive_concurrency(self):
+        client = MockAsyncClient(delay=0.01)
+        concurrency = AdaptiveConcurrency(initial=2, maximum=3)
+        api = AsyncAPI(client, 'http://github.com', concurrency=concurrency)
+        run(api.users.__gather__('GET', range(1, 21)))
+
+        self.assertEqual(concurrency.capacity, 3)
+        self.assertEqual(client.max_active, 3)
+
+    def test_rate_limit(self):
+        client = MockAsyncClient()
+        api = AsyncAPI(client, 'http://github.com',
+                       rate_limit=TokenBucket(100, burst=1))
+
+        started = time.time()
+        run(api.users.__gather__('GET', range(1, 6)))
+        self.assertGreaterEqual(time.time() - started, 0.035)
@@ -0,0 +1,115 @@
+
+from threading import Thread
+from unittest import TestCase
+
+from ladder import URLPath, API, LRUCache, cached
+
+
+class MockClient(object):
+    def get(self, *args, **kargs):
+        return ('get', args, kargs)
+
+
+class TestLRUCache(TestCase):
+    def test_get_set(self):
+        cache = LRUCache(2)
+        self.assertEqual(cache.get('a'), None)
+        cache.set('a', 1)
+        self.assertEqual(cache.get('a'), 1)
+        self.assertEqual(cache.info(), (1, 1, 2, 1))
+
+    def test_eviction(self):
+        cache = LRUCache(2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+        self.assertTrue('a' in cache)
+        self.assertFalse('b' in cache)
+        self.assertTrue('c' in cache)
+        self.assertEqual(len(cache), 2)
+
+    def test_clear(self):
+        cache = LRUCache()
+        cache.set('a', 1)
+        cache.get('a')
+        cache.clear()
+        self.assertEqual(cache.info(), (0, 0, 128, 0))
+
+
+class TestCached(TestCase):
+    def test_children_cached(self):
+        api = cached(URLPath('http://github.com'))
+        users = api.users
+        self.assertTrue(api.users is users)
+        self.assertTrue(api.users.orders is users.orders)
+        self.assertTrue(api('users', a=1) is api('users', a=1))
+        self.assertFalse(api('users', a=1) is api('users', a=2))
+        self.assertEqual(str(users.orders), 'http://github.com/users/orders')
+
+    def test_counters(self):
+        api = cached(URLPath('http://github.com'), maxsize=10)
+        api.users
+        api.users
+        api.users.orders
+        self.assertEqual(api.__cache__.info(), (2, 2, 10, 2))
+
+    def test_unhashable_not_cached(self):
+        api = cached(URLPath('http://github.com'))
+        self.assertFalse(api(['a', 'b']) is api(['a', 'b']))
+        self.assertFalse(api(a=[1, 2]) is api(a=[1, 2]))
+        self.assertEqual(len(api.__cache__), 0)
+        self.assertEqual(str(api(a=[1, 2])), 'http://github.com?a=1&a=2')
+
+    def test_equal_values_of_different_types(self):
+        path = cached(URLPath('/a'))
+        self.assertEqual(str(path(1)), '/a/1')
+        self.assertEqual(str(path(True)), '/a/True')
+        self.assertEqual(str(path(1.0)), '/a/1.0')
+        self.assertEqual(str(path((1,))), '/a/1')
+        self.assertEqual(str(path((True,))), '/a/True')
+        self.assertEqual(str(path(x=1)), '/a?x=1')
+        self.assertEqual(str(path(x=True)), '/a?x=True')
+
+    def test_shared_cache(self):
+        cache = LRUCache(10)
+        first = cached(URLPath('/first'), cache)
+        second = cached(URLPath('/second'), cache)
+        first.users
+        second.users
+        self.assertEqual(len(cache), 2)
+
+    def test_uncached_by_default(self):
+        url = URLPath('http://github.com')
+        self.assertFalse(url.users is url.users)
+        self.assertEqual(url.users.__cache__, None)
+
+    def test_api(self):
+        api = cached(API(MockClient(), 'http://github.com'))
+        self.assertTrue(api.users is api.users)
+        self.assertEqual(api.users.GET(),
+                         ('get', ('http://github.com/users',), {}))
+
+    def test_threads(self):
+        api = cached(URLPath('http://github.com'), maxsize=5)
+        results = []
+
+        def generate():
+            for index in range(1000):
+                results.append(str(api.users(index % 10 + 1)))
+
+        threads = [Thread(target=generate) for _ in range(8)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        info = api.__cache__.info()
+        self.assertEqual(len(results), 8000)
+        self.assertEqual(set(results),
+                         set('http://github.com/users/{0}'.format(index)
+                             for index in range(1, 11)))
+        self.assertEqual(info.hits + info.misses, 16000)
+        self.assertTrue(info.currsize <= 5)
@@ -1,10 +1,12 @@
 
+import pickle
 from unittest import TestCase
 
-from ladder import DelimitedPath
+from ladder import BytesPath, DelimitedPath
 
 
 PeriodPath = DelimitedPath(delimiter='.')
+KeyPath = BytesPath(delimiter=b':')
 
 
 class TestDelimitedPath(TestCase):
@@ -22,6 +24,41 @@ class TestDelimitedPath(TestCase):
             str(DelimitedPath(delimiter='.').foo.bar(1, 'one').baz().qux),
             'foo.bar.1.one.baz.qux')
 
+    def test_verbatim_path(self):
+        self.assertEqual(str(PeriodPath('..foo..')), '..foo..')
+        self.assertEqual(str(PeriodPath('..foo..').bar), '.foo.bar')
+
+    def test_segments(self):
+        path = PeriodPath('.foo').bar('baz.')
+        self.assertEqual(path.__segments__, ('foo', 'bar', 'baz'))
+        self.assertEqual(path.__leading__, '.')
+        self.assertEqual(path.__trailing__, '.')
+
+    def test_multiple_character_delimiter(self):
+        path = DelimitedPath('a', delimiter='::')
+        self.assertEqual(str(path(':', 'b')), 'a::b')
+        self.assertEqual(str(path('b:')), 'a::b')
+        self.assertEqual(str(path('::b::')), 'a::b::')
+        self.assertEqual(str(DelimitedPath(':', '::')('a')), 'a')
+
+        items = ['b:', ':b', 'b', 1]
+        self.assertEqual(path.__expand__(items),
+                         [str(path(item)) for item in items])
+        self.assertEqual(list(path.__iterproduct__(items, ['c'])),
+                         [str(path(item, 'c')) for item in items])
+
+    def test_deeply_nested_paths(self):
+        paths = ['bar']
+        for _ in range(5000):
+            paths = [paths]
+        self.assertEqual(str(PeriodPath('foo', paths, 1)), 'foo.bar.1')
+
+    def test_expand(self):
+        items = [1, 'foo', 'foo.bar', 0, '.foo', 'foo.']
+        for path in [PeriodPath('.foo'), PeriodPath(), DelimitedPath('foo')]:
+            self.assertEqual(path.__expand__(items),
+                             [str(path(item)) for item in items])
+
     def test_instance_regeneration(self):
         path = DelimitedPath('.foo')
         original = str(path)
@@ -55,3 +92,65 @@ class TestDelimitedPath(TestCase):
         path = 'start.of.path' / PeriodPath('end.of.path')
         self.assertTrue(isinstance(path, DelimitedPath))
         self.assertEqual(str(path), 'start.of.path.end.of.path')
+
+
+class TestBytesPath(TestCase):
+    def test_empty_path(self):
+        self.assertEqual(bytes(BytesPath()), b'')
+        self.assertEqual(bytes(KeyPath), b'')
+
+    def test_chaining(self):
+        path = KeyPath.user(42, b'profile', bytearray(b'v1'), u'caf\xe9')
+        self.assertEqual(bytes(path), b'user:42:profile:v1:caf\xc3\xa9')
+        self.assertEqual(path.__segments__,
+                         (b'user', b'42', b'profile', b'v1', b'caf\xc3\xa9'))
+
+    def test_str(self):
+        self.assertEqual(str(KeyPath(b'user', 1)), 'user:1')
+
+    def test_delimiters(self):
+        self.assertEqual(bytes(BytesPath(b'::a::', delimiter=b':')),
+                         b'::a::')
+        self.assertEqual(bytes(BytesPath(b':a', delimiter=b':')(b'b:')),
+                         b':a:b:')
+        self.assertEqual(bytes(BytesPath(b'a', delimiter=':')(1)), b'a:1')
+
+    def test_operators(self):
+        path = BytesPath(b'user', delimiter=b':')
+        self.assertEqual(bytes(path + b'1'), b'user:1')
+        self.assertEqual(bytes(b'app' / path), b'app:user')
+
+    def test_undecodable_paths(self):
+        path = BytesPath(b'\xff\x01', delimiter=b':')
+        self.assertEqual(bytes(b'pre' + path), b'pre:\xff\x01')
+        self.assertEqual(bytes(BytesPath(b'a', delimiter=b':')(path)),
+                         b'a:\xff\x01')
+
+    def test_expand(self):
+        items = [1, 0, -5, b'a', b':a', b'', u'b', bytearray(b'c'),
+                 [b'd', 2], None, True]
+        for path in [BytesPath(b'user', delimiter=b':'),
+                     BytesPath(b'user:', delimiter=b':'),
+                     BytesPath(b'x', delimiter=b'1'),
+                     BytesPath(b'x', delimiter=b'\x00'),
+                     BytesPath()]:
+            self.assertEqual(path.__expand__(items),
+                             [bytes(path(item)) for item in items])
+
+    def test_multiple_character_delimiter(self):
+        path = BytesPath(b'a', delimiter=b'::')
+        items = [b'b:', b':b', b'b', 1]
+        self.assertEqual(path.__expand__(items),
+                         [bytes(path(item)) for item in items])
+        self.assertEqual(bytes(path(b':', b'b')), b'a::b')
+
+    def test_iterproduct(self):
+        path = BytesPath(b'user', delimiter=b':')
+        self.assertEqual(list(path.__iterproduct__([1, 2], [b'a%s'])),
+                         [b'user:1:a%s', b'user:2:a%s'])
+        self.assertEqual(list(path.__iterproduct__([1, 2, 3], chunksize=2)),
+                         [[b'user:1', b'user:2'], [b'user:3']])
+
+    def test_pickle(self):
+        path = KeyPath.user(1)
+        self.assertEqual(bytes(pickle.loads(pickle.dumps(path))), b'user:1')
@@ -0,0 +1,131 @@
+
+from unittest import TestCase
+
+from ladder import API, Hook, RouteStats
+from ladder.hooks import normalizeroute
+
+
+class Response(object):
+    def __init__(self, status_code):
+        self.status_code = status_code
+
+
+class StatusClient(object):
+    def get(self, url, *args, **kargs):
+        if url.endswith('/error'):
+            raise ValueError(url)
+
+        return Response(404 if url.endswith('/missing') else 200)
+
+    def post(self, url, *args, **kargs):
+        return Response(201)
+
+
+class RecordingHook(Hook):
+    def __init__(self, name, events):
+        self.name = name
+        self.events = events
+
+    def before(self, call):
+        self.events.append((self.name, 'before', call.method, call.url,
+                            call.args, call.kargs))
+
+    def after(self, call):
+        self.events.append((self.name, 'after', call.response, call.exception))
+
+
+class TestNormalizeRoute(TestCase):
+    def test_normalizeroute(self):
+        tests = [
+            ('http://github.com', '/'),
+            ('http://github.com/users', '/users'),
+            ('http://github.com/users/123', '/users/{id}'),
+            ('http://github.com/users/123/?a=1#b', '/users/{id}/'),
+            ('/users/12/repos/34', '/users/{id}/repos/{id}'),
+            ('/keys/c9bf9e57-1685-4c89-bafb-ff5af830be8a', '/keys/{id}'),
+            ('/keys/C9BF9E5716854C89BAFBFF5AF830BE8A', '/keys/{id}'),
+            ('/users/dgilland', '/users/dgilland'),
+            ('/v2/users', '/v2/users'),
+        ]
+
+        for url, expected in tests:
+            self.assertEqual(normalizeroute(url), expected)
+
+
+class TestHooks(TestCase):
+    def test_hooks_called_in_order(self):
+        events = []
+        api = API(StatusClient(), 'http://github.com',
+                  hooks=[RecordingHook('a', events),
+                         RecordingHook('b', events)])
+        response = api.users(1).GET(timeout=1)
+
+        self.assertEqual(events, [
+            ('a', 'before', 'get', 'http://github.com/users/1', (),
+             {'timeout': 1}),
+            ('b', 'before', 'get', 'http://github.com/users/1', (),
+             {'timeout': 1}),
+            ('b', 'after', response, None),
+            ('a', 'after', response, None),
+        ])
+
+    def test_hooks_called_on_exception(self):
+        events = []
+        api = API(StatusClient(), 'http://github.com',
+                  hooks=[RecordingHook('a', events)])
+
+        self.assertRaises(ValueError, api.error.GET)
+        self.assertEqual(events[-1][:3], ('a', 'after', None))
+        self.assertTrue(isinstance(events[-1][3], ValueError))
+
+    def test_no_hooks(self):
+        api = API(StatusClient(), 'http://github.com')
+        self.assertEqual(api.users.__hooks__, ())
+        self.assertEqual(api.users.GET().status_code, 200)
+
+    def test_route_stats(self):
+        stats = RouteStats()
+        api = API(StatusClient(), 'http://github.com', hooks=[stats])
+
+        for user in [1, 2, 3]:
+            api.users(user).GET()
+
+        api.users.missing.GET()
+        api.users.POST()
+        self.assertRaises(ValueError, api.users(4).error.GET)
+
+        snapshot = stats.snapshot()
+        self.assertEqual(sorted(snapshot), [
+            ('GET', '/users/missing'),
+            ('GET', '/users/{id}'),
+            ('GET', '/users/{id}/error'),
+            ('POST', '/users'),
+        ])
+
+        users = snapshot[('GET', '/users/{id}')]
+        self.assertEqual(users.count, 3)
+        self.assertEqual(users.errors, 0)
+        self.assertEqual(users.statuses, {200: 3})
+        self.assertTrue(0 <= users.min <= users.mean <= users.max)
+        self.assertAlmostEqual(users.mean * 3, users.total)
+
+        error = snapshot[('GET', '/users/{id}/error')]
+        self.assertEqual((error.count, error.errors, error.statuses),
+                         (1, 1, {}))
+
+        total = stats.aggregate()
+        self.assertEqual(total.count, 6)
+        self.assertEqual(total.errors, 1)
+        self.assertEqual(total.statuses, {200: 3, 201: 1, 404: 1})
+
+        stats.reset()
+        self.assertEqual(stats.snapshot(), {})
+        self.assertEqual(stats.aggregate().count, 0)
+        self.assertEqual(stats.aggregate().min, None)
+
+    def test_route_stats_map(self):
+        stats = RouteStats()
+        api = API(StatusClient(), 'http://github.com', hooks=[stats])
+        list(api.users.__map__('GET', range(1, 11)))
+
+        self.assertEqual(stats.snapshot()[('GET', '/users/{id}')].count, 10)
@@ -0,0 +1,86 @@
+
+import subprocess
+import sys
+from unittest import TestCase, skipIf
+
+
+# Maximum microseconds spent importing ladder modules for the statement.
+IMPORT_BUDGETS = {
+    'import ladder': 20000,
+    'from ladder import DelimitedPath': 30000,
+    'from ladder import URLPath': 50000,
+}
+
+
+def importtime(statement):
+    """Return dict of the cumulative microseconds reported by ``python -X
+    importtime`` for each top-level module imported by `statement`.
+    """
+    output = subprocess.check_output(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        stderr=subprocess.STDOUT,
+        universal_newlines=True)
+    times = {}
+
+    for line in output.splitlines():
+        if not line.startswith('import time:'):
+            continue
+
+        _, cumulative, name = line.split('|')
+
+        if cumulative.strip().isdigit() and not name[1:].startswith(' '):
+            times[name.strip()] = int(cumulative)
+
+    return times
+
+
+def importedmodules(statement):
+    """Return set of modules imported after running `statement`."""
+    output = subprocess.check_output(
+        [sys.executable, '-c',
+         statement + '; import sys; print("\\n".join(sys.modules))'],
+        universal_newlines=True)
+    return set(output.split())
+
+
+@skipIf(sys.version_info < (3, 7), 'Requires lazy module attributes.')
+class TestImportTime(TestCase):
+    def test_budgets(self):
+        for statement, budget in IMPORT_BUDGETS.items():
+            # Best of a few runs since the first may compile bytecode.
+            spent = min(sum(elapsed for name, elapsed in
+                            importtime(statement).items()
+                            if name.split('.')[0] == 'ladder')
+                        for _ in range(3))
+            self.assertLessEqual(
+                spent, budget,
+                '{0!r} took {1}us to import ladder modules (budget {2}us)'
+                .format(statement, spent, budget))
+
+    def test_lazy_imports(self):
+        modules = importedmodules('from ladder import DelimitedPath')
+
+        self.assertIn('ladder.delimitedpath', modules)
+
+        for module in ['ladder.api', 'ladder.asyncapi', 'ladder.snapshot',
+                       'asyncio', 'urllib.parse', 'pickle']:
+            self.assertNotIn(module, modules)
+
+    def test_public_names(self):
+        import ladder
+
+        for name in ladder.__all__:
+            self.assertIn(name, dir(ladder))
+            self.assertEqual(getattr(ladder, name).__name__, name)
+
+        self.assertRaises(AttributeError, getattr, ladder, 'NotAName')
+
+        # Submodules are imported on first access too.
+        submodules = ['utils', 'api', 'urlpath', 'ladder']
+        statement = 'import ladder; ' + '; '.join(
+            'assert ladder.{0}.__name__ == "ladder.{0}"'.format(name)
+            for name in submodules)
+        modules = importedmodules(statement)
+
+        for name in submodules:
+            self.assertIn('ladder.' + name, modules)
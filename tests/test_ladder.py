@@ -1,9 +1,153 @@
 
+import pickle
+import struct
+import sys
 from unittest import TestCase
 
-from ladder import Ladder
+from ladder import (
+    Ladder, URLPath, OSPath, DelimitedPath, BytesPath, API, RouteStats,
+    cached)
+
+from .test_api import MockClient
 
 
 class TestLadder(TestCase):
     def test_not_implemented(self):
         self.assertRaises(NotImplementedError, Ladder)
+
+    def test_special_attributes_are_not_paths(self):
+        path = URLPath('/foo')
+        self.assertRaises(AttributeError, getattr, path, '__deepcopy__')
+        self.assertEqual(str(getattr(path, '__foo')), '/foo/__foo')
+
+    def test_compact_instances(self):
+        class Slotted(object):
+            __slots__ = ('slot',)
+
+        pointer_size = struct.calcsize('P')
+        # Object and GC headers of this interpreter.
+        header_size = sys.getsizeof(Slotted()) - pointer_size
+        paths = [
+            URLPath('http://github.com/foo', params={'a': 1}),
+            DelimitedPath('foo.bar', delimiter='.'),
+            OSPath('/foo/bar'),
+            API(None, 'http://github.com/foo')
+        ]
+
+        for path in paths:
+            str(path)
+            self.assertFalse(hasattr(path, '__dict__'))
+
+            # Headers plus a pointer per state attribute and ones for the
+            # cached path string, hash and children.
+            max_size = header_size + pointer_size * (len(path.__attrs__) +
+                                                     len(Ladder.__slots__))
+            self.assertLessEqual(sys.getsizeof(path), max_size)
+            self.assertLessEqual(sys.getsizeof(path.foo), max_size)
+
+    def test_equality(self):
+        client = MockClient()
+        equal = [
+            (URLPath('http://github.com/foo', params={'a': 1}),
+             URLPath('http://github.com')('foo?a=1')),
+            (URLPath('/foo/').bar, URLPath('/foo/bar')),
+            (DelimitedPath('foo', delimiter='.').bar,
+             DelimitedPath('foo.bar', delimiter='.')),
+            (BytesPath(b'foo', delimiter=b':')(1), BytesPath(b'foo:1', b':')),
+            (OSPath('/foo').bar, OSPath('/foo/bar')),
+            (API(client, 'http://github.com').foo,
+             API(client, 'http://github.com/foo')),
+        ]
+        unequal = [
+            (URLPath('http://github.com/foo'), URLPath('http://github.com')),
+            (URLPath('/foo', params={'a': 1}), URLPath('/foo', {'a': 2})),
+            (URLPath('/foo', params=[('a', 1), ('b', 2)]),
+             URLPath('/foo', params=[('b', 2), ('a', 1)])),
+            (URLPath('/foo', append_slash=True), URLPath('/foo/')),
+            (URLPath('/foo#top'), URLPath('/foo')),
+            (DelimitedPath('foo', delimiter='.').bar,
+             DelimitedPath('foo', delimiter=':').bar),
+            (URLPath('foo'), DelimitedPath('foo')),
+            (API(client, 'http://github.com').foo,
+             API(MockClient(), 'http://github.com').foo),
+            (API(client, 'http://github.com').foo,
+             URLPath('http://github.com').foo),
+        ]
+
+        for path, other in equal:
+            self.assertEqual(path, other)
+            self.assertFalse(path != other)
+            self.assertEqual(hash(path), hash(other))
+
+        for path, other in unequal:
+            self.assertNotEqual(path, other)
+            self.assertFalse(path == other)
+
+        self.assertNotEqual(URLPath('/foo'), '/foo')
+
+    def test_hash_is_cached(self):
+        path = URLPath('http://github.com', params={'a': 1}).foo
+        self.assertRaises(AttributeError, getattr, path, '__hashcode__')
+        hash(path)
+        self.assertEqual(path.__hashcode__, hash(path))
+        self.assertRaises(AttributeError, getattr, path.bar, '__hashcode__')
+
+        paths = {path: 1}
+        self.assertEqual(paths[URLPath('http://github.com/foo?a=1')], 1)
+        self.assertEqual(len(set([path, path(''), path()])), 1)
+
+    def test_equal_after_pickle(self):
+        path = URLPath('http://github.com/foo', params={'a': 1}).bar
+        self.assertEqual(pickle.loads(pickle.dumps(path)), path)
+
+    def test_shared_method_names(self):
+        api = API(None, 'http://github.com')
+        self.assertTrue(api.foo.__methods__ is api.__methods__)
+        self.assertTrue(API(None).__methods__ is api.__methods__)
+        self.assertFalse(API(None, upper_methods=False).__methods__ is
+                         api.__methods__)
+
+    def test_pickle(self):
+        paths = [
+            URLPath('http://github.com/foo?a=1', params={'b': [2, 3]},
+                    append_slash=True).bar(c=4)('#top'),
+            URLPath('//cdn.example.com')('/x', '?y=1'),
+            DelimitedPath('foo:bar:', delimiter=':').baz,
+            OSPath('/foo').bar('baz'),
+            API(MockClient(), 'http://github.com', upper_methods=False,
+                hooks=[RouteStats()]).users(1),
+        ]
+
+        for path in paths:
+            for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+                restored = pickle.loads(pickle.dumps(path, protocol))
+                self.assertTrue(type(restored) is type(path))
+                self.assertEqual(str(restored), str(path))
+                self.assertEqual(str(restored.qux(d=5)), str(path.qux(d=5)))
+
+                for attr in path.__attrs__:
+                    if attr not in ('__client__', '__hooks__'):
+                        self.assertEqual(getattr(restored, attr),
+                                         getattr(path, attr))
+
+        api = pickle.loads(pickle.dumps(paths[-1]))
+        self.assertEqual(api.get(), ('get', ('http://github.com/users/1',),
+                                     {}))
+        self.assertEqual(api.__hooks__[0].aggregate().count, 1)
+
+    def test_pickle_is_compact(self):
+        path = URLPath('http://github.com/foo', params={'a': 1}).bar
+        str(path)
+        data = pickle.dumps(path, pickle.HIGHEST_PROTOCOL)
+        self.assertFalse(b'__segments__' in data)
+        self.assertFalse(b'http://github.com/foo/bar' in data)
+
+    def test_pickle_cached(self):
+        path = cached(URLPath('http://github.com'), maxsize=10)
+        path.foo
+        paths = pickle.loads(pickle.dumps([path, path.foo]))
+        self.assertEqual(len(paths[0].__cache__), 0)
+        self.assertEqual(paths[0].__cache__.maxsize, 10)
+        self.assertTrue(paths[0].__cache__ is paths[1].__cache__)
+        self.assertTrue(paths[0].foo is paths[0].foo)
+        self.assertEqual(len(URLPath('/foo').__reduce__()[1]), 2)
@@ -0,0 +1,160 @@
+
+import threading
+import time
+from unittest import TestCase
+
+from ladder import API, AdaptiveConcurrency, RouteStats, TokenBucket
+from ladder._compat import timer
+
+
+class Response(object):
+    def __init__(self, status_code):
+        self.status_code = status_code
+
+
+class StatusClient(object):
+    def __init__(self, statuses=(), delay=0):
+        self.statuses = list(statuses)
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+        self.times = []
+
+    def get(self, url, **kargs):
+        with self.lock:
+            self.times.append(timer())
+            self.active += 1
+            self.max_active = max(self.active, self.max_active)
+            status = self.statuses.pop(0) if self.statuses else 200
+
+        time.sleep(self.delay)
+
+        with self.lock:
+            self.active -= 1
+
+        return Response(status)
+
+
+class TestTokenBucket(TestCase):
+    def test_reserve(self):
+        bucket = TokenBucket(100, burst=2)
+        self.assertEqual(bucket.reserve(), 0)
+        self.assertEqual(bucket.reserve(), 0)
+        self.assertAlmostEqual(bucket.reserve(), 0.01, delta=0.005)
+        self.assertAlmostEqual(bucket.reserve(), 0.02, delta=0.005)
+
+    def test_refill(self):
+        bucket = TokenBucket(1000, burst=1)
+        bucket.reserve()
+        time.sleep(0.01)
+        self.assertEqual(bucket.reserve(), 0)
+
+    def test_api_rate_limit(self):
+        client = StatusClient()
+        api = API(client, 'http://github.com',
+                  rate_limit=TokenBucket(50, burst=2))
+
+        for user in range(6):
+            api.users(user).GET()
+
+        # Two requests in a burst and the rest 20ms apart.
+        self.assertGreaterEqual(client.times[-1] - client.times[0], 0.07)
+        self.assertLess(client.times[1] - client.times[0], 0.01)
+
+    def test_api_rate_limit_per_netloc(self):
+        client = StatusClient()
+        limits = {'github.com': TokenBucket(10)}
+
+        for _ in range(5):
+            API(client, 'http://example.com', rate_limit=limits).GET()
+
+        self.assertLess(client.times[-1] - client.times[0], 0.05)
+
+        API(client, 'http://github.com', rate_limit=limits).GET()
+        API(client, 'http://github.com', rate_limit=limits).users.GET()
+        self.assertGreaterEqual(client.times[-1] - client.times[-2], 0.08)
+
+
+class TestAdaptiveConcurrency(TestCase):
+    def test_backoff(self):
+        limit = AdaptiveConcurrency(initial=16, minimum=2)
+        limit.record(429, timer(), 0.1)
+        self.assertEqual(limit.capacity, 8)
+        limit.record(503, timer(), 0.1)
+        self.assertEqual(limit.capacity, 4)
+
+        # Requests started before the last decrease don't decrease it again.
+        limit.record(429, timer() - 1, 0.1)
+        self.assertEqual(limit.capacity, 4)
+
+        limit.record(429, timer(), 0.1)
+        limit.record(429, timer(), 0.1)
+        self.assertEqual(limit.capacity, 2)
+
+    def test_increase(self):
+        limit = AdaptiveConcurrency(initial=2, maximum=4, latency=0.5)
+
+        for _ in range(2):
+            limit.record(200, timer(), 0.1)
+        self.assertEqual(limit.capacity, 2)
+        limit.record(200, timer(), 0.1)
+        self.assertEqual(limit.capacity, 3)
+
+        # Slow or failed requests don't increase it.
+        for _ in range(10):
+            limit.record(200, timer(), 1)
+            limit.record(None, timer(), 0.1, failed=True)
+        self.assertEqual(limit.capacity, 3)
+
+        for _ in range(100):
+            limit.record(None, timer(), 0.1)
+        self.assertEqual(limit.capacity, 4)
+
+    def test_api_concurrency(self):
+        client = StatusClient(delay=0.02)
+        api = API(client, 'http://github.com', concurrency=2)
+        list(api.users.__map__('GET', range(1, 9), max_workers=8))
+
+        self.assertEqual(client.max_active, 2)
+        self.assertEqual(api.users.__concurrency__.capacity, 2)
+        self.assertTrue(api.users.__concurrency__ is api.__concurrency__)
+        self.assertEqual(api.__concurrency__.active, 0)
+
+    def test_api_adaptive_concurrency(self):
+        client = StatusClient(statuses=[429, 429], delay=0.01)
+        concurrency = AdaptiveConcurrency(initial=8)
+        api = API(client, 'http://github.com', concurrency=concurrency)
+
+        api.users.GET()
+        api.users.GET()
+        self.assertEqual(concurrency.capacity, 2)
+
+        list(api.users.__map__('GET', range(1, 41), max_workers=8))
+        self.assertGreater(concurrency.capacity, 2)
+        self.assertLessEqual(client.max_active, concurrency.capacity)
+
+    def test_api_adaptive_concurrency_with_hooks(self):
+        stats = RouteStats()
+        concurrency = AdaptiveConcurrency(initial=8)
+        api = API(StatusClient(statuses=[429]), 'http://github.com',
+                  hooks=[stats], concurrency=concurrency)
+
+        api.users.GET()
+        self.assertEqual(concurrency.capacity, 4)
+        self.assertEqual(stats.snapshot()[('GET', '/users')].statuses,
+                         {429: 1})
+
+    def test_api_failed_request(self):
+        class ErrorClient(object):
+            def get(self, url):
+                error = ValueError(url)
+                error.response = Response(503)
+                raise error
+
+        concurrency = AdaptiveConcurrency(initial=4)
+        api = API(ErrorClient(), 'http://github.com', concurrency=concurrency)
+
+        self.assertRaises(ValueError, api.GET)
+        self.assertEqual(concurrency.capacity, 2)
+        self.assertEqual(concurrency.active, 0)
@@ -19,6 +19,53 @@ class TestOSPath(TestCase):
             str(OSPath().foo.bar(1, 'one').baz().qux),
             'foo/bar/1/one/baz/qux')
 
+    def test_expand(self):
+        items = [1, 'foo', 'foo/bar', 0, '/foo', 'foo/']
+        for path in [OSPath('/foo'), OSPath()]:
+            self.assertEqual(path.__expand__(items),
+                             [str(path(item)) for item in items])
+
+    def test_product(self):
+        path = OSPath('/data')
+        regions = ['us', 'eu']
+        dates = (date for date in ['2014-01-01', '2014-01-02'])
+        paths = path.__iterproduct__(regions, dates, range(1, 3))
+        self.assertFalse(isinstance(paths, list))
+        self.assertEqual(list(paths), [
+            '/data/us/2014-01-01/1',
+            '/data/us/2014-01-01/2',
+            '/data/us/2014-01-02/1',
+            '/data/us/2014-01-02/2',
+            '/data/eu/2014-01-01/1',
+            '/data/eu/2014-01-01/2',
+            '/data/eu/2014-01-02/1',
+            '/data/eu/2014-01-02/2',
+        ])
+
+    def test_product_normalized_items(self):
+        path = OSPath('/data')
+        regions = ['us', '/eu', 0, ['ap', 'south']]
+        shards = [1, 'a/']
+        self.assertEqual(list(path.__iterproduct__(regions, shards)),
+                         [str(path(region, shard))
+                          for region in regions
+                          for shard in shards])
+
+    def test_product_trailing_separator(self):
+        path = OSPath('/data')
+        regions = ['us/', 'eu']
+        self.assertEqual(list(path.__iterproduct__(regions, ['2024'])),
+                         ['/data/us/2024', '/data/eu/2024'])
+        self.assertEqual(list(path.__iterproduct__(regions, ['2024'])),
+                         [str(path(region, '2024')) for region in regions])
+
+    def test_product_chunks(self):
+        chunks = OSPath('data').__iterproduct__(['a', 'b', 'c'], [1],
+                                                chunksize=2)
+        self.assertEqual(list(chunks), [['data/a/1', 'data/b/1'],
+                                        ['data/c/1']])
+        self.assertRaises(TypeError, OSPath().__iterproduct__, [1], size=2)
+
     def test_instance_regeneration(self):
         path = OSPath('/foo')
         original = str(path)
@@ -0,0 +1,132 @@
+
+from unittest import TestCase
+
+from ladder import Params
+from ladder._compat import urlencode
+from ladder.params import ENCODED_PARAMS
+
+
+class TestParams(TestCase):
+    def test_empty(self):
+        params = Params()
+        self.assertEqual(list(params), [])
+        self.assertEqual(len(params), 0)
+        self.assertFalse(params)
+        self.assertEqual(params.getall('a'), ())
+        self.assertEqual(params.get('a', 1), 1)
+
+    def test_append_extend_prepend(self):
+        params = (Params([('a', 1)])
+                  .append('b', 2)
+                  .extend([('a', 3), ('c', 4)])
+                  .prepend([('d', 5)])
+                  .extend([]))
+        self.assertEqual(list(params), [('d', 5), ('a', 1), ('b', 2),
+                                        ('a', 3), ('c', 4)])
+        self.assertEqual(params.getall('a'), (1, 3))
+        self.assertEqual(params.get('a'), 1)
+        self.assertEqual(params.keys(), ['d', 'a', 'b', 'c'])
+        self.assertTrue('c' in params)
+        self.assertFalse('e' in params)
+        self.assertEqual(len(params), 5)
+
+    def test_structure_sharing(self):
+        parent = Params().extend([('a', 1), ('b', 2)])
+        child = parent.append('c', 3)
+        self.assertTrue(child._parent is parent)
+        self.assertEqual(child._pairs, (('c', 3),))
+        self.assertEqual(list(parent), [('a', 1), ('b', 2)])
+
+    def test_replace(self):
+        params = Params([('a', 1), ('b', 2)]).append('a', 3)
+        self.assertEqual(list(params.replace('a', 4)),
+                         [('b', 2), ('a', 4)])
+        self.assertEqual(list(params.replace('a', [4, 5])),
+                         [('b', 2), ('a', 4), ('a', 5)])
+        self.assertEqual(params.replace('a', 4).getall('a'), (4,))
+        self.assertEqual(params.replace('a', 4).append('a', 6).getall('a'),
+                         (4, 6))
+        self.assertEqual(list(params.replace('c', 7)),
+                         [('a', 1), ('b', 2), ('a', 3), ('c', 7)])
+
+    def test_remove(self):
+        params = Params([('a', 1), ('b', 2)]).prepend([('a', 0)])
+        removed = params.remove('a', 'c')
+        self.assertEqual(list(removed), [('b', 2)])
+        self.assertEqual(removed.getall('a'), ())
+        self.assertTrue(params.remove('c') is params)
+        self.assertEqual(list(removed.append('a', 3).prepend([('a', 4)])),
+                         [('a', 4), ('b', 2), ('a', 3)])
+
+    def test_getall_after_flatten(self):
+        params = Params([('a', 1)]).append('a', 2)
+        list(params)
+        child = params.remove('a').append('a', 3)
+        self.assertEqual(params.append('a', 4).getall('a'), (1, 2, 4))
+        self.assertEqual(child.getall('a'), (3,))
+        self.assertEqual(list(child.append('b', 5)), [('a', 3), ('b', 5)])
+
+    def test_deep_chain(self):
+        params = Params()
+
+        for index in range(1000):
+            params = params.append('k{0}'.format(index % 10), index)
+
+        self.assertEqual(len(params), 1000)
+        self.assertEqual(params.getall('k9')[-1], 999)
+        self.assertEqual(len(params.replace('k0', 'x')), 901)
+
+    def test_equality(self):
+        params = Params([('a', 1)]).append('b', 2)
+        self.assertEqual(params, Params([('a', 1), ('b', 2)]))
+        self.assertEqual(params, (('a', 1), ('b', 2)))
+        self.assertEqual(params, [('a', 1), ('b', 2)])
+        self.assertNotEqual(params, Params([('b', 2), ('a', 1)]))
+        self.assertNotEqual(params, 'a=1&b=2')
+        self.assertEqual(hash(params), hash(Params([('a', 1), ('b', 2)])))
+        self.assertEqual(repr(params), "Params([('a', 1), ('b', 2)])")
+
+    def test_encode(self):
+        params = Params([('a', 1), ('b', 'x y')])
+        child = params.append('c', '&').prepend([('d', True)])
+        self.assertEqual(params.encode(), 'a=1&b=x+y')
+        self.assertEqual(child.encode(), 'd=True&a=1&b=x+y&c=%26')
+        self.assertEqual(child.encode(), urlencode(tuple(child)))
+        self.assertEqual(Params().encode(), '')
+
+    def test_encode_extends_parent(self):
+        params = Params([('a', 1)])
+        query = params.encode()
+        child = params.append('b', 2)
+        self.assertEqual(child.encode(), 'a=1&b=2')
+        self.assertTrue(params._query is query)
+        self.assertEqual(child.append('c', 3)._parent._query, 'a=1&b=2')
+
+    def test_encode_without_kept_parent(self):
+        params = Params()
+
+        for index in range(2000):
+            params = params.append('k', index)
+
+        self.assertEqual(params.encode(), urlencode(tuple(params)))
+        self.assertTrue(params._parent._query is None)
+
+    def test_encode_removed(self):
+        params = Params([('a', 1), ('b', 2)]).append('a', 3)
+        params.encode()
+        self.assertEqual(params.replace('a', [4, 5]).encode(), 'b=2&a=4&a=5')
+        self.assertEqual(params.remove('b').append('c', 6).encode(),
+                         'a=1&a=3&c=6')
+        self.assertEqual(params.remove('a', 'b').encode(), '')
+
+    def test_encode_cache(self):
+        ENCODED_PARAMS.clear()
+        params = Params([('a', 1), ('b', True), ('c', [1])])
+        self.assertEqual(params.encode(), urlencode(tuple(params)))
+        self.assertEqual(ENCODED_PARAMS.info().currsize, 2)
+
+        # Equal values of different types are cached separately.
+        self.assertEqual(Params([('a', True), ('b', 1)]).encode(),
+                         'a=True&b=1')
+        self.assertEqual(Params([('a', 1)]).encode(), 'a=1')
+        self.assertEqual(ENCODED_PARAMS.info().hits, 1)
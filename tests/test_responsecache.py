@@ -0,0 +1,175 @@
+
+from unittest import TestCase
+
+from ladder import API, ResponseCache, RouteStats
+
+
+class Response(object):
+    def __init__(self, status_code, body=None, headers=None):
+        self.status_code = status_code
+        self.body = body
+        self.headers = headers or {}
+
+
+class StubClient(object):
+    """Client which returns a new response body for each request unless the
+    request's validators match the current version of the resource.
+    """
+    def __init__(self, etag=None, modified=None, status_code=200):
+        self.etag = etag
+        self.modified = modified
+        self.status_code = status_code
+        self.requests = []
+
+    def request(self, method, url, **kargs):
+        self.requests.append((method, url, kargs))
+        headers = kargs.get('headers') or {}
+
+        if ((self.etag and headers.get('If-None-Match') == self.etag) or
+                (self.modified and
+                 headers.get('If-Modified-Since') == self.modified)):
+            return Response(304)
+
+        response_headers = {}
+
+        if self.etag:
+            response_headers['ETag'] = self.etag
+
+        if self.modified:
+            response_headers['Last-Modified'] = self.modified
+
+        return Response(self.status_code, len(self.requests), response_headers)
+
+    def get(self, url, **kargs):
+        return self.request('get', url, **kargs)
+
+    def head(self, url, **kargs):
+        return self.request('head', url, **kargs)
+
+    def post(self, url, **kargs):
+        return self.request('post', url, **kargs)
+
+
+class TestResponseCache(TestCase):
+    def test_cached(self):
+        client = StubClient()
+        cache = ResponseCache(maxsize=10)
+        api = API(client, 'http://github.com', response_cache=cache)
+
+        self.assertEqual(api.users(1).GET().body, 1)
+        self.assertEqual(api.users(1).GET().body, 1)
+        self.assertEqual(api.users(1).HEAD().body, 2)
+        self.assertEqual(api.users(2).GET().body, 3)
+        self.assertEqual(len(client.requests), 3)
+        self.assertEqual(cache.info().hits, 1)
+
+    def test_uncached_methods(self):
+        client = StubClient()
+        api = API(client, 'http://github.com',
+                  response_cache=ResponseCache())
+
+        self.assertEqual(api.users.POST().body, 1)
+        self.assertEqual(api.users.POST().body, 2)
+
+    def test_canonical_url(self):
+        client = StubClient()
+        api = API(client, 'http://GitHub.com', response_cache=ResponseCache())
+
+        api.users(a=1, b=2).GET()
+        api.users(b=2)(a=1).GET()
+        API(client, 'http://github.com/users#top', params={'b': 2},
+            response_cache=api.__response_cache__)(a=1).GET()
+        self.assertEqual(len(client.requests), 1)
+
+        # The order of multiple values of the same param matters.
+        api.users(a=[2, 1]).GET()
+        api.users(a=[1, 2]).GET()
+        self.assertEqual(len(client.requests), 3)
+
+    def test_arguments(self):
+        client = StubClient()
+        api = API(client, 'http://github.com', response_cache=ResponseCache())
+
+        api.users.GET(headers={'Accept': 'json', 'X': 'y'})
+        api.users.GET(headers={'X': 'y', 'Accept': 'json'})
+        api.users.GET(headers={'Accept': 'xml'})
+        api.users.GET(timeout=[object()])
+        api.users.GET(timeout=[object()])
+        self.assertEqual(len(client.requests), 4)
+
+        # Unhashable arguments aren't cached.
+        api.users.GET(data=bytearray(b'a'))
+        api.users.GET(data=bytearray(b'a'))
+        self.assertEqual(len(client.requests), 6)
+
+    def test_errors_not_cached(self):
+        client = StubClient(status_code=500)
+        api = API(client, 'http://github.com', response_cache=ResponseCache())
+
+        api.users.GET()
+        api.users.GET()
+        self.assertEqual(len(client.requests), 2)
+
+    def test_ttl(self):
+        client = StubClient()
+        api = API(client, 'http://github.com',
+                  response_cache=ResponseCache(ttl=0))
+
+        self.assertEqual(api.users.GET().body, 1)
+        self.assertEqual(api.users.GET().body, 2)
+
+        api = API(client, 'http://github.com',
+                  response_cache=ResponseCache(ttl=None))
+        self.assertEqual(api.users.GET().body, 3)
+        self.assertEqual(api.users.GET().body, 3)
+
+    def test_lru_eviction(self):
+        client = StubClient()
+        api = API(client, 'http://github.com',
+                  response_cache=ResponseCache(maxsize=2))
+
+        for user in [1, 2, 1, 3, 1, 2]:
+            api.users(user).GET()
+
+        self.assertEqual([url for _, url, _ in client.requests], [
+            'http://github.com/users/1',
+            'http://github.com/users/2',
+            'http://github.com/users/3',
+            'http://github.com/users/2',
+        ])
+
+    def test_revalidate_etag(self):
+        client = StubClient(etag='"v1"')
+        api = API(client, 'http://github.com',
+                  response_cache=ResponseCache(ttl=0))
+
+        first = api.users.GET(headers={'Accept': 'json'})
+        self.assertTrue(api.users.GET(headers={'Accept': 'json'}) is first)
+        self.assertEqual(client.requests[-1][2]['headers'],
+                         {'Accept': 'json', 'If-None-Match': '"v1"'})
+
+        client.etag = '"v2"'
+        second = api.users.GET(headers={'Accept': 'json'})
+        self.assertEqual(second.body, 3)
+        self.assertEqual(second.headers['ETag'], '"v2"')
+        self.assertTrue(api.users.GET(headers={'Accept': 'json'}) is second)
+
+    def test_revalidate_last_modified(self):
+        modified = 'Wed, 21 Oct 2015 07:28:00 GMT'
+        client = StubClient(modified=modified)
+        api = API(client, 'http://github.com',
+                  response_cache=ResponseCache(ttl=0))
+
+        first = api.users.GET()
+        self.assertTrue(api.users.GET() is first)
+        self.assertEqual(client.requests[-1][2],
+                         {'headers': {'If-Modified-Since': modified}})
+
+    def test_hooks_see_only_requests(self):
+        stats = RouteStats()
+        api = API(StubClient(), 'http://github.com', hooks=[stats],
+                  response_cache=ResponseCache())
+
+        api.users.GET()
+        api.users.GET()
+        self.assertEqual(stats.aggregate().count, 1)
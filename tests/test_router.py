@@ -0,0 +1,92 @@
+
+from unittest import TestCase
+
+from ladder import URLPath, DelimitedPath, RouteIndex, RouteTemplate
+
+
+class TestRouteIndex(TestCase):
+    def setUp(self):
+        api = URLPath('https://api.example.com', params={'key': 'secret'})
+        self.users = api.users('{user_id}')
+        self.routes = [
+            api.users,
+            self.users,
+            self.users.orders('{order_id}'),
+            api.users.me,
+            api.files('{name}.{ext}'),
+            RouteTemplate(api.repos('{owner}', '{repo}', 'v{version}')),
+            '/static/{}/{}',
+        ]
+        self.index = RouteIndex(self.routes)
+
+    def test_match(self):
+        tests = [
+            ('/users', self.routes[0], {}),
+            ('/users/42', self.routes[1], {'user_id': '42'}),
+            ('https://other.com/users/42/?a=1#top', self.routes[1],
+             {'user_id': '42'}),
+            (self.users.orders(7), self.routes[2],
+             {'user_id': '{user_id}', 'order_id': '7'}),
+            ('users/me', self.routes[3], {}),
+            ('/files/report.tar.gz', self.routes[4],
+             {'name': 'report', 'ext': 'tar.gz'}),
+            ('/repos/dgilland/ladder/v2', self.routes[5],
+             {'owner': 'dgilland', 'repo': 'ladder', 'version': '2'}),
+            ('/repos/dgilland/ladder/2', None, None),
+            ('/static/css/site.css', self.routes[6],
+             {'0': 'css', '1': 'site.css'}),
+            ('/users//5/', self.routes[1], {'user_id': '5'}),
+            ('//users/5', None, None),
+            ('/users/5/orders', None, None),
+            ('/files/report', None, None),
+            ('/', None, None),
+        ]
+
+        for path, route, params in tests:
+            match = self.index.match(path)
+
+            if route is None:
+                self.assertEqual(match, None)
+            else:
+                self.assertTrue(match.route is route)
+                self.assertTrue(match.value is route)
+                self.assertEqual(match.params, params)
+
+        self.assertEqual(len(self.index), 7)
+
+    def test_backtracking(self):
+        index = RouteIndex(['/a/{x}/c', '/a/b/d', '/{y}/b/c/d'])
+        self.assertEqual(index.match('/a/b/c').params, {'x': 'b'})
+        self.assertEqual(index.match('/a/b/d').route, '/a/b/d')
+        self.assertEqual(index.match('/a/b/c/d').params, {'y': 'a'})
+
+    def test_values(self):
+        index = RouteIndex()
+        index.add('/users/{id}', 'user')
+        index.add('/users/{user_id}', 'replaced')
+        index.add('/', 'root')
+        index.add('/{{literal}}', 'braces')
+
+        self.assertEqual(len(index), 3)
+        self.assertEqual(index.match('/users/1'),
+                         ('/users/{user_id}', 'replaced', {'user_id': '1'}))
+        self.assertEqual(index.match('').value, 'root')
+        self.assertEqual(index.match('/{literal}').value, 'braces')
+
+    def test_delimiter(self):
+        path = DelimitedPath('app', delimiter='.')
+        index = RouteIndex([path.handlers('{name}'), path('{name}').handler],
+                           delimiter='.')
+
+        self.assertEqual(index.match('app.handlers.login').params,
+                         {'name': 'login'})
+        self.assertEqual(index.match(path.users.handler).params,
+                         {'name': 'users'})
+        self.assertEqual(index.match('app/users/handler'), None)
+
+    def test_many_routes(self):
+        index = RouteIndex('/service{0}/items/{{item_id}}'.format(number)
+                           for number in range(5000))
+        match = index.match('/service4999/items/abc')
+        self.assertEqual(match.route, '/service4999/items/{item_id}')
+        self.assertEqual(match.params, {'item_id': 'abc'})
@@ -0,0 +1,117 @@
+
+import threading
+import time
+from unittest import TestCase
+
+from ladder import API, ResponseCache
+from ladder.singleflight import SingleFlight
+
+
+class BlockingClient(object):
+    def __init__(self):
+        self.release = threading.Event()
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def request(self, method, url, **kargs):
+        with self.lock:
+            self.calls.append((method, url))
+
+        self.release.wait(5)
+
+        if url.endswith('/error'):
+            raise ValueError(url)
+
+        return [method, url, len(self.calls)]
+
+    def get(self, url, **kargs):
+        return self.request('get', url, **kargs)
+
+    def post(self, url, **kargs):
+        return self.request('post', url, **kargs)
+
+
+def call_concurrently(client, funcs):
+    results = [None] * len(funcs)
+
+    def run(index):
+        try:
+            results[index] = funcs[index]()
+        except Exception as exc:  # pylint: disable=broad-except
+            results[index] = exc
+
+    threads = [threading.Thread(target=run, args=(index,))
+               for index in range(len(funcs))]
+
+    for thread in threads:
+        thread.start()
+
+    # Give every thread time to join the call in flight before it finishes.
+    time.sleep(0.1)
+    client.release.set()
+
+    for thread in threads:
+        thread.join()
+
+    return results
+
+
+class TestSingleFlight(TestCase):
+    def test_coalesce(self):
+        client = BlockingClient()
+        api = API(client, 'http://github.com', coalesce=True)
+        results = call_concurrently(client, [api.config.GET] * 10)
+
+        self.assertEqual(client.calls, [('get', 'http://github.com/config')])
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertEqual(len(api.__flights__), 0)
+
+        # Later calls aren't coalesced with finished ones.
+        self.assertEqual(api.config.GET()[2], 2)
+
+    def test_coalesce_by_request(self):
+        client = BlockingClient()
+        api = API(client, 'http://github.com', coalesce=True)
+        results = call_concurrently(client, [
+            api.config(a=1, b=2).GET,
+            api.config(b=2, a=1).GET,
+            api.config(a=1).GET,
+            api.config.POST,
+            api.config.POST,
+            lambda: api.config.GET(data=bytearray()),
+            lambda: api.config.GET(data=bytearray()),
+        ])
+
+        self.assertTrue(results[0] is results[1])
+        self.assertEqual(len(client.calls), 6)
+
+    def test_coalesce_exception(self):
+        client = BlockingClient()
+        api = API(client, 'http://github.com', coalesce=True)
+        results = call_concurrently(client, [api.error.GET] * 5)
+
+        self.assertEqual(len(client.calls), 1)
+        self.assertTrue(all(isinstance(result, ValueError)
+                            for result in results))
+
+    def test_coalesce_with_response_cache(self):
+        client = BlockingClient()
+        cache = ResponseCache()
+        api = API(client, 'http://github.com', coalesce=True,
+                  response_cache=cache)
+        results = call_concurrently(client, [api.config.GET] * 5)
+
+        self.assertEqual(len(client.calls), 1)
+        self.assertTrue(api.config.GET() is results[0])
+        self.assertEqual(cache.info().currsize, 1)
+
+    def test_not_coalesced(self):
+        client = BlockingClient()
+        api = API(client, 'http://github.com')
+        self.assertEqual(api.__flights__, None)
+        call_concurrently(client, [api.config.GET] * 3)
+        self.assertEqual(len(client.calls), 3)
+
+    def test_none_key(self):
+        flight = SingleFlight()
+        self.assertEqual(flight.do(None, lambda value: value, 1), 1)
@@ -0,0 +1,136 @@
+
+import os
+import pickle
+import shutil
+import tempfile
+from unittest import TestCase
+
+from ladder import (
+    API,
+    BytesPath,
+    DelimitedPath,
+    OSPath,
+    RouteSnapshot,
+    URLPath,
+    dumpsnapshot)
+
+
+class Client(object):
+    def get(self, url, *args, **kargs):
+        return url
+
+
+class TestRouteSnapshot(TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tmpdir, 'routes.snapshot')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def snapshot(self, base, endpoints, loadbase=None):
+        dumpsnapshot(self.filename, base, endpoints)
+        snapshot = RouteSnapshot(self.filename,
+                                 base if loadbase is None else loadbase)
+        self.addCleanup(snapshot.close)
+        return snapshot
+
+    def test_urlpath(self):
+        base = URLPath('https://api.example.com/v1', params={'key': 'x'})
+        endpoints = {
+            'users': base.users,
+            'user': base.users('{user_id}'),
+            'orders': base.users('{user_id}', 'orders/'),
+            'search': base.search(q='ladder', page=2),
+            'docs': base('docs#intro'),
+            'root': base,
+        }
+        snapshot = self.snapshot(base, endpoints)
+
+        self.assertEqual(len(snapshot), len(endpoints))
+        self.assertEqual(list(snapshot), sorted(endpoints))
+
+        for name, endpoint in endpoints.items():
+            self.assertIn(name, snapshot)
+            self.assertEqual(str(snapshot[name]), str(endpoint))
+            self.assertEqual(type(snapshot[name]), URLPath)
+
+        self.assertEqual(str(snapshot['orders'].items), str(
+            endpoints['orders'].items))
+        self.assertEqual(snapshot['search'].__params__.getall('page'), (2,))
+
+    def test_lazy_shared_generation(self):
+        base = URLPath('https://api.example.com')
+        snapshot = self.snapshot(base, {'user': base.users('{user_id}'),
+                                        'users': base.users,
+                                        'me': base.users.me})
+
+        self.assertEqual(snapshot.endpoints, {})
+        user = snapshot['user']
+        self.assertIs(snapshot['user'], user)
+        self.assertIs(snapshot['users'], snapshot.nodes[0])
+        self.assertEqual(len(snapshot.nodes), 3)
+        self.assertEqual(str(snapshot['me']),
+                         'https://api.example.com/users/me')
+
+    def test_missing(self):
+        base = URLPath('/api')
+        snapshot = self.snapshot(base, {'a': base.a, 'c': base.c})
+
+        self.assertNotIn('b', snapshot)
+        self.assertIsNone(snapshot.get('b'))
+        self.assertRaises(KeyError, lambda: snapshot['b'])
+        self.assertEqual(str(snapshot.get('c')), '/api/c')
+
+    def test_nested_names(self):
+        base = DelimitedPath('app', delimiter=':')
+        snapshot = self.snapshot(base, {
+            'users': {'all': base.users, 'one': base.users('{id}')},
+            'queue': base.queue(':')})
+
+        self.assertEqual(list(snapshot), ['queue', 'users.all', 'users.one'])
+        self.assertEqual(str(snapshot['users.one']), 'app:users:{id}')
+        self.assertEqual(str(snapshot['queue']), 'app:queue:')
+
+    def test_bytespath(self):
+        base = BytesPath(b'app', delimiter=b':')
+        endpoints = {'user': base(b'users', b'\xff\x01'),
+                     'queue': base.queue(b':')}
+        snapshot = self.snapshot(base, endpoints)
+
+        for name, endpoint in endpoints.items():
+            self.assertEqual(bytes(snapshot[name]), bytes(endpoint))
+            self.assertEqual(snapshot[name], endpoint)
+
+        self.assertEqual(bytes(snapshot['user'](1)), b'app:users:\xff\x01:1')
+
+    def test_ospath(self):
+        base = OSPath('/var')
+        snapshot = self.snapshot(base, {'www': base.www.html})
+        self.assertEqual(str(snapshot['www']),
+                         os.path.join('/var', 'www', 'html'))
+
+    def test_api_with_new_client(self):
+        base = API(Client(), 'https://api.example.com')
+        snapshot = self.snapshot(base,
+                                 {'user': base.users.dgilland},
+                                 API(Client(), 'https://api.example.com'))
+
+        self.assertEqual(snapshot['user'].GET(),
+                         'https://api.example.com/users/dgilland')
+        self.assertIsNot(snapshot['user'].__client__, base.__client__)
+
+    def test_endpoint_not_from_base(self):
+        base = URLPath('https://api.example.com/v1')
+
+        self.assertRaises(ValueError, dumpsnapshot, self.filename, base,
+                          {'v2': URLPath('https://api.example.com/v2')})
+        self.assertRaises(ValueError, dumpsnapshot, self.filename, base,
+                          {'path': DelimitedPath('v1')})
+
+    def test_not_a_snapshot(self):
+        with open(self.filename, 'wb') as fileobj:
+            pickle.dump(URLPath('/'), fileobj)
+
+        self.assertRaises(ValueError, RouteSnapshot, self.filename,
+                          URLPath('/'))
@@ -0,0 +1,55 @@
+
+from unittest import TestCase
+
+from ladder import URLPath, DelimitedPath, RouteTemplate
+
+
+class TestRouteTemplate(TestCase):
+    def setUp(self):
+        self.api = URLPath('https://api.github.com', params={'key': 'a b'})
+
+    def test_format(self):
+        route = RouteTemplate(self.api.users('{user_id}').repos)
+        self.assertEqual(route.fields, ('user_id',))
+        self.assertEqual(route(user_id='dgilland'),
+                         'https://api.github.com/users/dgilland/repos?key=a+b')
+
+    def test_matches_generated_path(self):
+        route = RouteTemplate(self.api('/users/{user_id}/orders/{order_id}/'))
+        self.assertEqual(route(user_id=1, order_id=2),
+                         str(self.api.users(1).orders(2, '/')))
+
+    def test_positional_arguments(self):
+        route = RouteTemplate(URLPath('/users/{0}/orders/{1}'))
+        self.assertEqual(route(1, 2), '/users/1/orders/2')
+
+    def test_query_params(self):
+        route = RouteTemplate(self.api.users('{user_id}#top'))
+        # Keyword arguments aren't ordered on Python < 3.6.
+        self.assertEqual(route(user_id=1, sort=['a', 'b']),
+                         ('https://api.github.com/users/1'
+                          '?key=a+b&sort=a&sort=b#top'))
+        self.assertIn(route(user_id=1, page=2, sort='a'),
+                      ['https://api.github.com/users/1?key=a+b&page=2&sort=a'
+                       '#top',
+                       'https://api.github.com/users/1?key=a+b&sort=a&page=2'
+                       '#top'])
+
+    def test_fragment_placeholder(self):
+        route = RouteTemplate(URLPath('/users#{section}'))
+        self.assertEqual(route.fields, ('section',))
+        self.assertEqual(route(section='repos'), '/users#repos')
+        self.assertEqual(route(section='repos', a=1), '/users?a=1#repos')
+
+    def test_missing_arguments(self):
+        route = RouteTemplate(URLPath('/users/{user_id}/orders/{order_id}'))
+        self.assertRaises(TypeError, route, user_id=1)
+        self.assertRaises(TypeError, route, user_id=1, page=1)
+        self.assertRaises(TypeError, RouteTemplate(URLPath('/users/{0}')))
+
+    def test_delimited_path(self):
+        route = RouteTemplate(DelimitedPath('user:{user_id}:orders', ':'))
+        self.assertEqual(route.fields, ('user_id',))
+        self.assertEqual(route(user_id=1), 'user:1:orders')
+        self.assertRaises(TypeError, route, page=1)
+        self.assertRaises(TypeError, route, user_id=1, page=1)
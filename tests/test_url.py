@@ -1,5 +1,5 @@
 
-from unittest import TestCase
+from unittest import SkipTest, TestCase
 
 from ladder import URLPath
 
@@ -12,6 +12,16 @@ class TestURLPath(TestCase):
     def test_single_slash_url(self):
         self.assertEqual(str(URLPath('/')), '/')
 
+    def test_root_url(self):
+        root = URLPath('/')
+        self.assertEqual(str(root('?x=1')), '/?x=1')
+        self.assertEqual(str(root('/?x=1')), '/?x=1')
+        self.assertEqual(str(root(['/', '?x=1'])), '/?x=1')
+        self.assertEqual(str(root('#top')), '/#top')
+        self.assertEqual(str(root('/')), '/')
+        self.assertEqual(str(URLPath('//')), '/')
+        self.assertEqual(str(URLPath()('/', '#top')), '/#top')
+
     def test_initialized_url(self):
         self.assertEqual(
             str(URLPath('http://github.com')),
@@ -43,6 +53,60 @@ class TestURLPath(TestCase):
         params = str(url).split('?')[1].split('&')
         self.assertEqual(set(params), set(['a=1', 'a=2', 'a=3']))
 
+    def test_rendering_cached(self):
+        url = URLPath('http://github.com', params={'a': 1}).foo(b=2)
+        # Python 2 str() encodes the rendered text so check it directly.
+        rendered = url.__getpathway__()
+        self.assertEqual(rendered, 'http://github.com/foo?a=1&b=2')
+        self.assertTrue(url.__getpathway__() is rendered)
+        self.assertEqual(str(url.bar), 'http://github.com/foo/bar?a=1&b=2')
+        self.assertTrue(url.__getpathway__() is rendered)
+
+    def test_params_state(self):
+        url = URLPath('http://github.com?a=1', params={'b': 2})(c=3)('?d=4')
+        self.assertEqual(list(url.__params__),
+                         [('d', '4'), ('a', '1'), ('b', 2), ('c', 3)])
+        self.assertEqual(url.__params__.getall('c'), (3,))
+
+    def test_replace_params(self):
+        url = URLPath('http://github.com', params={'a': 1}).foo(b=2)(a=3)
+        self.assertEqual(str(url.__replaceparams__(a=4)),
+                         'http://github.com/foo?b=2&a=4')
+        self.assertEqual(str(url.__replaceparams__(a=[4, 5], c=6).bar),
+                         'http://github.com/foo/bar?b=2&a=4&a=5&c=6')
+        self.assertEqual(str(url), 'http://github.com/foo?a=1&b=2&a=3')
+
+    def test_remove_params(self):
+        url = URLPath('http://github.com', params={'a': 1}).foo(b=2)(a=3)
+        self.assertEqual(str(url.__removeparams__('a')),
+                         'http://github.com/foo?b=2')
+        self.assertEqual(str(url.__removeparams__('a', 'b')),
+                         'http://github.com/foo')
+        self.assertEqual(str(url.__removeparams__('a')(a=4)),
+                         'http://github.com/foo?b=2&a=4')
+
+    def test_link(self):
+        url = URLPath('http://github.com/foo', params={'a': 1})('#top')
+        self.assertEqual(str(url.__link__('/bar?b=2')),
+                         'http://github.com/bar?b=2')
+        self.assertEqual(str(url.__link__('https://api.github.com/bar')),
+                         'https://api.github.com/bar')
+        self.assertEqual(str(url.__link__('//cdn.github.com/x').y),
+                         'http://cdn.github.com/x/y')
+
+    def test_link_relative(self):
+        url = URLPath('http://h.com/api/items', params={'p': 1})
+        self.assertEqual(str(url.__link__('?p=2')),
+                         'http://h.com/api/items?p=2')
+        self.assertEqual(str(url.__link__('items2')),
+                         'http://h.com/api/items2')
+        self.assertEqual(str(url.__link__('../v2/items?p=2')),
+                         'http://h.com/v2/items?p=2')
+        self.assertEqual(str(url.__link__('#top')),
+                         'http://h.com/api/items?p=1#top')
+        self.assertEqual(str(URLPath('/api/items').__link__('?p=2')),
+                         '/api/items?p=2')
+
     def test_instance_regeneration(self):
         url = URLPath('/foo')
         original = str(url)
@@ -61,6 +125,56 @@ class TestURLPath(TestCase):
             str(URLPath('http://github.com:8000').foo.bar),
             'http://github.com:8000/foo/bar')
 
+    def test_protocol_relative(self):
+        url = URLPath('//github.com/foo')
+        self.assertEqual(str(url), '//github.com/foo')
+        self.assertEqual(str(url.bar), '//github.com/foo/bar')
+
+    def test_urlsplit(self):
+        url = URLPath('https://github.com:8000', params={'a': 1})
+        url = url.foo('bar#top')
+        self.assertEqual(tuple(url.__urlsplit__),
+                         ('https', 'github.com:8000', 'foo/bar', 'a=1', 'top'))
+        self.assertEqual(url.__netloc__, 'github.com:8000')
+        self.assertEqual(str(url), 'https://github.com:8000/foo/bar?a=1#top')
+
+    def test_netloc_parsed_once(self):
+        url = URLPath('http://github.com')
+        self.assertEqual(str(url('http://example.com')),
+                         'http://github.com/http://example.com')
+        self.assertEqual(str(URLPath()('http://example.com').foo),
+                         'http://example.com/foo')
+
+    def test_expand(self):
+        url = URLPath('https://github.com/api', params={'a': 1}).users
+        items = [1, 'foo', 'foo/bar', 0, '', '/foo/', 'foo?b=2', ['c', 'd']]
+        expected = [str(url(item)) for item in items]
+        self.assertEqual(url.__expand__(items), expected)
+        self.assertEqual(list(url.__iterexpand__(iter(items))), expected)
+        self.assertEqual(url.__expand__(range(1, 4)),
+                         ['https://github.com/api/users/1?a=1',
+                          'https://github.com/api/users/2?a=1',
+                          'https://github.com/api/users/3?a=1'])
+
+    def test_product(self):
+        url = URLPath('/a%20b', params={'q': '%'})
+        paths = list(url.__iterproduct__(['x', 'y?z=1'], [1, 2]))
+        self.assertEqual(paths[:2], ['/a%20b/x/1?q=%25', '/a%20b/x/2?q=%25'])
+        self.assertEqual(paths[2:], [str(url('y?z=1', 1)),
+                                     str(url('y?z=1', 2))])
+
+    def test_expand_numpy(self):
+        try:
+            import numpy as np
+        except ImportError:
+            raise SkipTest('NumPy not installed')
+
+        url = URLPath('/users', append_slash=True)
+        paths = url.__expand__(np.arange(1, 4), numpy=True)
+        self.assertTrue(isinstance(paths, np.ndarray))
+        self.assertEqual(paths.tolist(),
+                         ['/users/1/', '/users/2/', '/users/3/'])
+
     def test_add_operator_with_url(self):
         url = URLPath('start/of/path') + URLPath('end/of/path')
         self.assertTrue(isinstance(url, URLPath))
@@ -88,3 +202,26 @@ class TestURLPath(TestCase):
         url = 'start/of/path' / URLPath('end/of/path')
         self.assertTrue(isinstance(url, URLPath))
         self.assertEqual(str(url), 'start/of/path/end/of/path')
+
+    def test_segments_shared_with_parent(self):
+        url = URLPath('http://github.com/foo')
+        child = url.bar('baz/')
+        self.assertEqual(child.__segments__, ('foo', 'bar', 'baz'))
+        self.assertTrue(child.__segments__[0] is url.__segments__[0])
+        self.assertEqual(child.__trailing__, '/')
+        self.assertEqual(str(child), 'http://github.com/foo/bar/baz/')
+
+    def test_deep_chaining(self):
+        url = URLPath('/')
+        for index in range(1, 1001):
+            url = url(index)
+        self.assertEqual(len(url.__segments__), 1000)
+        self.assertEqual(str(url), '/' + '/'.join(map(str, range(1, 1001))))
+
+    def test_fragment(self):
+        url = URLPath('http://github.com/foo#top')
+        self.assertEqual(str(url), 'http://github.com/foo#top')
+        self.assertEqual(str(url.bar(a=1)),
+                         'http://github.com/foo/bar?a=1#top')
+        self.assertEqual(str(url('bar#bottom')),
+                         'http://github.com/foo/bar#bottom')